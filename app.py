@@ -39,7 +39,7 @@ import tkinter as tk
 from tkinter import messagebox, filedialog
 
 from ui.ui_base import COLORS
-from core.storage import SessionManager, SETTINGS_FILE, SESSIONS_FILE
+from core.storage import SessionManager, SETTINGS_FILE, SESSIONS_FILE, flush_pending_writes
 from ui.dialogs import (
     CustomInputDialog,
     RestoreBackupDialog,
@@ -82,6 +82,7 @@ from core.constants import (
     MAX_BACKUPS_PER_FILE,
     GAME_EXIT_TIMEOUT_SECONDS,
     GAME_EXIT_CHECK_INTERVAL,
+    SESSION_WATCH_INTERVAL_SECONDS,
 )
 
 
@@ -348,6 +349,7 @@ class NWNManagerApp:
         self.root.after(200, _initial_select)
 
         self.sessions.cleanup_dead()
+        self.sessions.start_watcher(SESSION_WATCH_INTERVAL_SECONDS)
         # Try to detect a game already started outside the manager
         try:
             self.detect_existing_session()
@@ -430,14 +432,6 @@ class NWNManagerApp:
         if hasattr(self, "ui_state_manager"):
             self.ui_state_manager.set_appwindow()
 
-    def start_move(self, event):
-        if hasattr(self, "ui_state_manager"):
-            self.ui_state_manager.start_move(event)
-
-    def do_move(self, event):
-        if hasattr(self, "ui_state_manager"):
-            self.ui_state_manager.do_move(event)
-
     def minimize_window(self):
         if hasattr(self, "ui_state_manager"):
             self.ui_state_manager.minimize_window()
@@ -461,6 +455,8 @@ class NWNManagerApp:
         # Fallback: actually close
         if hasattr(self, "log_monitor_manager"):
             self.log_monitor_manager.backup_all_logs()
+        # Queued saves must land before atexit releases the single-instance lock
+        flush_pending_writes()
             
         if hasattr(self, "ui_state_manager"):
             self.ui_state_manager.close_app_window()
@@ -469,8 +465,12 @@ class NWNManagerApp:
         """Force quit the application (from tray menu)."""
         if hasattr(self, 'tray_manager'):
             self.tray_manager.stop()
+        if hasattr(self, 'sessions'):
+            self.sessions.stop_watcher()
         if hasattr(self, "log_monitor_manager"):
             self.log_monitor_manager.backup_all_logs()
+        # Queued saves must land before atexit releases the single-instance lock
+        flush_pending_writes()
         if hasattr(self, "ui_state_manager"):
             self.ui_state_manager.close_app_window()
 
@@ -489,9 +489,16 @@ class NWNManagerApp:
 
     def load_data(self):
         self.data_manager.load_data()
+        self.invalidate_hotkey_count()
 
     def save_data(self):
         self.data_manager.save_data()
+        self.invalidate_hotkey_count()
+
+    def invalidate_hotkey_count(self):
+        """Hotkey binds may have changed; make the status bar recount them."""
+        if getattr(self, "status_bar_comp", None):
+            self.status_bar_comp.invalidate_hotkey_count()
 
     def schedule_save(self, delay_ms: int = SAVE_DEBOUNCE_DELAY_MS):
         """Debounced save: schedule `save_data` after `delay_ms` milliseconds, cancelling previous schedule.
@@ -904,7 +911,7 @@ class NWNManagerApp:
             # 4. Immediate UI updates
             if hasattr(self, 'status_bar_comp') and self.status_bar_comp:
                 try:
-                    self.status_bar_comp.update()
+                    self.status_bar_comp.request_update()
                 except Exception: pass
             
             # Refresh hotkeys screen if active
@@ -962,6 +969,7 @@ class NWNManagerApp:
         """Toggle log monitor. Delegates to LogMonitorManager."""
         if hasattr(self, 'log_monitor_manager'):
             self.log_monitor_manager.toggle_log_monitor_enabled()
+        self.mark_status_dirty()
 
     def open_log_monitor_dialog(self):
         """Open log monitor dialog. Delegates to LogMonitorManager."""
@@ -995,6 +1003,11 @@ class NWNManagerApp:
         """Update all status bar labels."""
         if hasattr(self, "ui_state_manager"):
             self.ui_state_manager._update_status_bar()
+
+    def mark_status_dirty(self):
+        """Ask the status bar loop to refresh promptly."""
+        if hasattr(self, "ui_state_manager"):
+            self.ui_state_manager.mark_status_dirty()
     
     
     
@@ -1176,13 +1189,15 @@ class NWNManagerApp:
             self.server_manager.toggle_server_ui()
 
     def monitor_processes(self):
-        self.sessions.cleanup_dead()
+        # Periodic tick: the session watcher does the probing in the background
+        self.sessions.cleanup_dead(probe=False)
         # Only refresh list if session count changed (avoid constant redraws)
-        current_count = len(self.sessions.sessions) if hasattr(self.sessions, "sessions") else 0
+        current_count = self.sessions.count
         previous_count = getattr(self, "_last_session_count", 0)
         
         if current_count != previous_count:
             self._last_session_count = current_count
+            self.mark_status_dirty()
             self.refresh_list()
             
             # Update log monitor tracked files
@@ -1713,9 +1728,10 @@ class NWNManagerApp:
     def close_game_for_profile(self, profile):
         """Close a specific profile's game session sequentially to avoid overlapping macro issues."""
         key = getattr(profile, "cdKey", None)
-        if not key or key not in self.sessions.sessions:
+        # Single lookup: the session watcher may rebind the dict between two reads
+        pid = self.sessions.sessions.get(key) if key else None
+        if pid is None:
             return
-        pid = self.sessions.sessions[key]
 
         if not hasattr(self, '_close_queue'):
             self._close_queue = []
@@ -22,9 +22,19 @@ SAVE_DEBOUNCE_DELAY_MS = 3000
 # Status bar update interval
 STATUS_BAR_UPDATE_INTERVAL_MS = 1000
 
+# Adaptive status bar scheduling: tick fast shortly after a change, back off when idle
+STATUS_BAR_FAST_INTERVAL_MS = 500
+STATUS_BAR_IDLE_INTERVAL_MS = 2000
+
 # Delay for inline action hide
 INLINE_ACTION_HIDE_DELAY_MS = 150
 
+# Settle time after the last root <Configure> before re-evaluating layout
+RESIZE_DEBOUNCE_MS = 50
+
+# Minimum spacing between window geometry updates while dragging (~60 fps)
+DRAG_FRAME_INTERVAL_MS = 16
+
 
 # === TIMING CONSTANTS (seconds) ===
 
@@ -37,6 +47,18 @@ GAME_EXIT_TIMEOUT_SECONDS = 5
 # Sleep interval when waiting for game exit
 GAME_EXIT_CHECK_INTERVAL = 0.1
 
+# How often the background session watcher polls process liveness
+SESSION_WATCH_INTERVAL_SECONDS = 2.0
+
+# Status bar stays on the fast interval this long after the last detected change
+STATUS_BAR_ACTIVE_WINDOW_SECONDS = 5.0
+
+# A gap between status ticks longer than this means the system was suspended
+STATUS_BAR_SUSPEND_GAP_SECONDS = 10.0
+
+# Repeat clicks on the same status bar toggle within this window are ignored
+STATUS_TOGGLE_DEBOUNCE_SECONDS = 0.15
+
 
 # === UI CONSTANTS ===
 
@@ -239,7 +239,7 @@ class DataManager:
             lm_cfg = LogMonitorConfig.from_dict(self.app.log_monitor_state.config or {})
             hotkeys_cfg = HotkeysConfig.from_dict(getattr(self.app, "hotkeys_config", {}))
             # Get current sessions from SessionManager
-            sessions_data = self.app.sessions.sessions if hasattr(self.app, 'sessions') else {}
+            sessions_data = self.app.sessions.snapshot() if hasattr(self.app, 'sessions') else {}
             
             # Update current group's servers before saving
             if hasattr(self.app, 'server_groups') and hasattr(self.app, 'server_group'):
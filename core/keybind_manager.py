@@ -273,7 +273,7 @@ class MultiHotkeyManager:
             return
 
         # Smart pause if >1 session running and setting enabled
-        session_count = len(getattr(self.app.sessions, "sessions", {}) or {})
+        session_count = self.app.sessions.count
         multi_session_pause = False
         if session_count > 1:
             settings = getattr(self.app, "settings", None)
@@ -311,7 +311,7 @@ class LogMonitorManager:
             if new_state: self.start_log_monitor()
             else: self.stop_log_monitor()
             
-            if hasattr(self.app, 'status_bar_comp'): self.app.status_bar_comp.update()
+            if hasattr(self.app, 'status_bar_comp'): self.app.status_bar_comp.request_update()
         except Exception: pass
 
     def update_log_monitor_status_label(self, waiting: bool = False):
@@ -337,6 +337,12 @@ class LogMonitorManager:
             if hasattr(self.app, "log_monitor_status_lbl") and self.app.log_monitor_status_lbl:
                 self.app.log_monitor_status_lbl.config(text=text, fg=fg)
         except Exception: pass
+        self._notify_status_change()
+
+    def _notify_status_change(self):
+        """Monitor started/stopped: have the status bar refresh on its next fast tick."""
+        if hasattr(self.app, "mark_status_dirty"):
+            self.app.mark_status_dirty()
 
     def update_slayer_ui_state(self):
         try:
@@ -370,11 +376,13 @@ class LogMonitorManager:
                 self.app.log_monitor_state.slayer_monitor.update_config(log_path=log_path)
             if not self.app.log_monitor_state.slayer_monitor.is_running():
                 self.app.log_monitor_state.slayer_monitor.start()
+                self._notify_status_change()
         except Exception: pass
 
     def _stop_slayer_monitor(self):
         if self.app.log_monitor_state.slayer_monitor and self.app.log_monitor_state.slayer_monitor.is_running():
             self.app.log_monitor_state.slayer_monitor.stop()
+            self._notify_status_change()
 
     def _handle_open_wounds_detection(self, line: str):
         if not line or "open wounds hit" not in line.lower(): return
@@ -396,7 +404,7 @@ class LogMonitorManager:
         ts = ts_match.group(1) if ts_match else None
         if ts and ts == self._last_auto_fog_ts: return
         self._last_auto_fog_ts = ts
-        if len(getattr(self.app.sessions, 'sessions', {}) or {}) == 1:
+        if self.app.sessions.count == 1:
             threading.Thread(target=lambda: self._send_console_command("mainscene.fog 0"), daemon=True).start()
 
     def _send_console_command(self, command: str):
@@ -433,8 +441,8 @@ class LogMonitorManager:
 
     def _update_slayer_hit_counter_ui(self):
         try:
-            if hasattr(self.app, 'status_bar_labels') and "slayer_hits" in self.app.status_bar_labels:
-                self.app.status_bar_labels["slayer_hits"].config(text=f"({self.app.log_monitor_state.slayer_hit_count} hits)", fg=COLORS["warning"])
+            if getattr(self.app, 'status_bar_comp', None):
+                self.app.status_bar_comp.request_update()
             if hasattr(self.app, 'slayer_counter_label'):
                 self.app.slayer_counter_label.config(text=f"Hits: {self.app.log_monitor_state.slayer_hit_count}")
         except Exception: pass
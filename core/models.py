@@ -4,7 +4,7 @@ import re
 from dataclasses import dataclass, field, asdict
 from typing import List, Dict, Any
 
-from core.storage import read_json, write_json_atomic
+from core.storage import read_json, write_json_deferred
 CDKEY_PATTERN = re.compile(r"^[A-Z0-9]{5}(?:-[A-Z0-9]{5}){6}$")
 
 
@@ -382,7 +382,9 @@ class Settings:
         payload["profiles"] = [p.to_dict() for p in self.profiles]
         payload["log_monitor"] = self.log_monitor.to_dict()
         payload["hotkeys"] = self.hotkeys.to_dict()
-        payload["sessions"] = self.sessions
+        # Snapshot: the payload is handed to the deferred writer thread while
+        # SessionManager keeps mutating its live dict on the Tk thread
+        payload["sessions"] = dict(self.sessions)
         
         # Manual conversion for server_groups
         payload["server_groups"] = {
@@ -441,7 +443,7 @@ def load_settings(path: str, fallback_docs: str, fallback_exe: str) -> Settings:
 
 def save_settings(path: str, settings: Settings) -> None:
     try:
-        write_json_atomic(path, settings.to_dict(), indent=4, ensure_ascii=False)
+        write_json_deferred(path, settings.to_dict(), indent=4, ensure_ascii=False)
     except Exception:
         # Silent failure by design to avoid crashing UI; caller can log
         pass
@@ -1,8 +1,13 @@
 import os
 import json
+import time
+import queue
+import atexit
 import ctypes
 import tempfile
 import logging
+import threading
+from ctypes import wintypes
 
 from utils.win_automation import (
     kernel32,
@@ -10,9 +15,76 @@ from utils.win_automation import (
     STILL_ACTIVE,
 )
 
+PROCESS_VM_READ = 0x0010
+
+# Private prototypes bound once at import: argtypes/restype are fixed up front so
+# ctypes skips per-call conversion, and the shared kernel32 functions stay untouched.
+_OpenProcess = ctypes.WINFUNCTYPE(
+    wintypes.HANDLE, wintypes.DWORD, wintypes.BOOL, wintypes.DWORD
+)(("OpenProcess", kernel32))
+_GetExitCodeProcess = ctypes.WINFUNCTYPE(
+    wintypes.BOOL, wintypes.HANDLE, ctypes.POINTER(ctypes.c_ulong)
+)(("GetExitCodeProcess", kernel32))
+_CloseHandle = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HANDLE)(("CloseHandle", kernel32))
+try:
+    _GetProcessImageFileNameW = ctypes.WINFUNCTYPE(
+        wintypes.DWORD, wintypes.HANDLE, wintypes.LPWSTR, wintypes.DWORD
+    )(("GetProcessImageFileNameW", ctypes.windll.psapi))
+except Exception:
+    _GetProcessImageFileNameW = None
+
+TH32CS_SNAPPROCESS = 0x00000002
+INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+
+class PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ("dwSize", wintypes.DWORD),
+        ("cntUsage", wintypes.DWORD),
+        ("th32ProcessID", wintypes.DWORD),
+        ("th32DefaultHeapID", ctypes.c_size_t),
+        ("th32ModuleID", wintypes.DWORD),
+        ("cntThreads", wintypes.DWORD),
+        ("th32ParentProcessID", wintypes.DWORD),
+        ("pcPriClassBase", ctypes.c_long),
+        ("dwFlags", wintypes.DWORD),
+        ("szExeFile", ctypes.c_wchar * 260),
+    ]
+
+
+_CreateToolhelp32Snapshot = ctypes.WINFUNCTYPE(
+    wintypes.HANDLE, wintypes.DWORD, wintypes.DWORD
+)(("CreateToolhelp32Snapshot", kernel32))
+_Process32FirstW = ctypes.WINFUNCTYPE(
+    wintypes.BOOL, wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)
+)(("Process32FirstW", kernel32))
+_Process32NextW = ctypes.WINFUNCTYPE(
+    wintypes.BOOL, wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)
+)(("Process32NextW", kernel32))
+
+
+def _live_process_names() -> dict[int, str] | None:
+    """Return {pid: lowercase exe name} for all running processes from one
+    Toolhelp32 snapshot, or None if the snapshot could not be taken."""
+    snapshot = _CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if not snapshot or snapshot == INVALID_HANDLE_VALUE:
+        return None
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        live = {}
+        ok = _Process32FirstW(snapshot, ctypes.byref(entry))
+        while ok:
+            live[entry.th32ProcessID] = entry.szExeFile.lower()
+            ok = _Process32NextW(snapshot, ctypes.byref(entry))
+        return live
+    finally:
+        _CloseHandle(snapshot)
+
 SETTINGS_FILE = "nwn_settings.json"
 SESSIONS_FILE = "nwn_sessions.json"
 
+
 def read_json(path: str, default: dict | None = None) -> dict | None:
     if not os.path.exists(path):
         return default
@@ -23,6 +95,9 @@ def read_json(path: str, default: dict | None = None) -> dict | None:
         return default
 
 
+_TMP_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
 def write_json_atomic(
     path: str,
     data: dict,
@@ -36,9 +111,19 @@ def write_json_atomic(
     fd = None
     tmp_path = None
     try:
-        fd, tmp_path = tempfile.mkstemp(prefix=".tmp", dir=dir_path or None)
+        # All saves go through the single deferred-writer thread, so a fixed sibling
+        # temp name is never contended and avoids mkstemp's random-name probing.
+        try:
+            fd = os.open(path + ".tmp", _TMP_OPEN_FLAGS, 0o600)
+            tmp_path = path + ".tmp"
+        except OSError:
+            # Fixed name unusable (e.g. left read-only or locked by a scanner on
+            # Windows) - fall back to a unique temp file
+            fd, tmp_path = tempfile.mkstemp(prefix=".tmp", dir=dir_path or None)
         with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii)
+            # Compact separators when not pretty-printing: fewer bytes to write and fsync
+            separators = (",", ":") if indent is None else None
+            json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii, separators=separators)
             f.flush()
             os.fsync(f.fileno())
         fd = None
@@ -59,6 +144,71 @@ def write_json_atomic(
                 pass
 
 
+# === DEFERRED WRITER ===
+# Saves are handed to a single daemon thread; writes to the same path that
+# arrive within the coalescing window of the first one collapse into one atomic write.
+
+WRITE_COALESCE_WINDOW = 0.1  # seconds
+
+_write_queue: "queue.Queue[tuple[str, dict, dict]]" = queue.Queue()
+_writer_thread: threading.Thread | None = None
+_writer_lock = threading.Lock()
+
+
+def write_json_deferred(path: str, data: dict, **kwargs) -> None:
+    """Queue an atomic JSON write of `data` (which must not be mutated afterwards)."""
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(target=_writer_loop, daemon=True)
+            _writer_thread.start()
+    _write_queue.put((path, data, kwargs))
+
+
+def flush_pending_writes() -> None:
+    """Block until every queued write has reached disk."""
+    # Without a live writer nothing would drain the queue and join() would hang
+    if _writer_thread is not None and _writer_thread.is_alive():
+        _write_queue.join()
+
+
+def _writer_loop() -> None:
+    while True:
+        path, data, kwargs = _write_queue.get()
+        pending = {path: (data, kwargs)}
+        taken = 1
+        try:
+            # Coalesce for at most one window after the first write, so a steady
+            # stream of saves can't postpone it indefinitely
+            deadline = time.monotonic() + WRITE_COALESCE_WINDOW
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    path, data, kwargs = _write_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                pending[path] = (data, kwargs)
+                taken += 1
+            for path, (data, kwargs) in pending.items():
+                try:
+                    write_json_atomic(path, data, **kwargs)
+                except Exception:
+                    logging.exception("Deferred write to %s failed", path)
+        finally:
+            for _ in range(taken):
+                _write_queue.task_done()
+
+
+# The quit paths flush explicitly before the single-instance lock is released;
+# this is only a backstop for other exits (atexit runs it after release_lock)
+atexit.register(flush_pending_writes)
+
+# How long cleanup_dead() waits for the watcher to finish a requested sweep
+SWEEP_WAIT_TIMEOUT = 2.0  # seconds
+
+
 class SessionManager:
     """Manages active game sessions.
     
@@ -69,6 +219,18 @@ class SessionManager:
         self._app = None
         self.filepath = None
         self.sessions: dict[str, int] = {}
+        # Reusable out-buffers for is_alive(); guarded since cleanup_dead() also runs off-thread
+        self._probe_lock = threading.Lock()
+        self._exit_buf = ctypes.c_ulong()
+        self._image_buf = ctypes.create_unicode_buffer(512)
+        # Background liveness watcher (see start_watcher)
+        self._sessions_lock = threading.Lock()
+        self._watcher_thread: threading.Thread | None = None
+        self._watcher_stop = threading.Event()
+        # Wakes the watcher for an immediate sweep; waiters are set once it completes
+        self._sweep_now = threading.Event()
+        self._sweep_waiters: list[threading.Event] = []
+        self._dirty = False
         
         # Check if it's an app reference or file path
         if hasattr(filepath_or_app, 'save_data'):
@@ -91,57 +253,148 @@ class SessionManager:
         if self._app:
             # Sync to app's sessions and save
             if hasattr(self._app, '_settings_sessions'):
-                self._app._settings_sessions = self.sessions.copy()
+                self._app._settings_sessions = self.snapshot()
             self._app.save_data()
         elif self.filepath:
-            write_json_atomic(self.filepath, self.sessions)
+            write_json_deferred(self.filepath, self.snapshot())
+
+    def snapshot(self) -> dict[str, int]:
+        """Copy of the sessions, safe to hand to another thread."""
+        with self._sessions_lock:
+            return dict(self.sessions)
+
+    @property
+    def count(self) -> int:
+        """Number of tracked sessions."""
+        return len(self.sessions)
 
     def add(self, key: str, pid: int) -> None:
-        self.sessions[key] = pid
+        with self._sessions_lock:
+            self.sessions[key] = pid
         self.save()
 
+    def _allowed_exes(self) -> list[str]:
+        allowed_exes = ["nwmain.exe", "xnwn.exe"]
+        if self._app and hasattr(self._app, 'settings') and self._app.settings.exe_path:
+            conf_exe = os.path.basename(self._app.settings.exe_path).lower()
+            if conf_exe and conf_exe not in allowed_exes:
+                allowed_exes.append(conf_exe)
+        return allowed_exes
+
     def is_alive(self, pid: int) -> bool:
         try:
-            h_process = kernel32.OpenProcess(PROCESS_QUERY_INFORMATION | 0x0010, False, pid)  # 0x0010 = PROCESS_VM_READ
+            h_process = _OpenProcess(PROCESS_QUERY_INFORMATION | PROCESS_VM_READ, False, pid)
             if not h_process:
                 return False
-            exit_code = ctypes.c_ulong()
-            kernel32.GetExitCodeProcess(h_process, ctypes.byref(exit_code))
-            
-            if exit_code.value != STILL_ACTIVE:
-                kernel32.CloseHandle(h_process)
-                return False
-                
-            # Extra safety: check image name to prevent false positives when PIDs are reused by other programs
             try:
-                psapi = ctypes.windll.psapi
-                buf = ctypes.create_unicode_buffer(512)
-                if psapi.GetProcessImageFileNameW(h_process, buf, 512) > 0:
-                    # Get base name of configured executable
-                    name = os.path.basename(buf.value).lower()
-                    allowed_exes = ["nwmain.exe", "xnwn.exe"]
-                    if self._app and hasattr(self._app, 'settings') and self._app.settings.exe_path:
-                        conf_exe = os.path.basename(self._app.settings.exe_path).lower()
-                        if conf_exe and conf_exe not in allowed_exes:
-                            allowed_exes.append(conf_exe)
-                    
-                    if name not in allowed_exes:
-                        kernel32.CloseHandle(h_process)
-                        return False
-            except Exception:
-                pass
-                
-            kernel32.CloseHandle(h_process)
-            return True
+                with self._probe_lock:
+                    return self._probe_handle(h_process)
+            finally:
+                _CloseHandle(h_process)
         except Exception:
             return False
 
-    def cleanup_dead(self) -> None:
-        dead = []
-        for key, pid in list(self.sessions.items()):
-            if not self.is_alive(pid):
-                dead.append(key)
-        for k in dead:
-            del self.sessions[k]
-        if dead:
-            self.save()
\ No newline at end of file
+    def _probe_handle(self, h_process) -> bool:
+        exit_buf = self._exit_buf
+        _GetExitCodeProcess(h_process, ctypes.byref(exit_buf))
+        if exit_buf.value != STILL_ACTIVE:
+            return False
+
+        # Extra safety: check image name to prevent false positives when PIDs are reused by other programs
+        try:
+            buf = self._image_buf
+            if _GetProcessImageFileNameW and _GetProcessImageFileNameW(h_process, buf, 512) > 0:
+                # Get base name of configured executable
+                name = os.path.basename(buf.value).lower()
+                if name not in self._allowed_exes():
+                    return False
+        except Exception:
+            pass
+
+        return True
+
+    # === BACKGROUND WATCHER ===
+
+    def start_watcher(self, interval: float = 5.0) -> None:
+        """Poll session liveness on a daemon thread every `interval` seconds.
+
+        While it runs it is the only thread that probes: cleanup_dead() asks it
+        for a sweep instead of probing on the caller's thread.
+        """
+        if self.is_watching():
+            return
+        self._watcher_stop.clear()
+        self._sweep_now.clear()
+        self._watcher_thread = threading.Thread(target=self._watch, args=(interval,), daemon=True)
+        self._watcher_thread.start()
+
+    def stop_watcher(self) -> None:
+        self._watcher_stop.set()
+        self._sweep_now.set()
+
+    def is_watching(self) -> bool:
+        return bool(self._watcher_thread and self._watcher_thread.is_alive())
+
+    def _watch(self, interval: float) -> None:
+        while True:
+            self._sweep_now.wait(interval)
+            self._sweep_now.clear()
+            with self._sessions_lock:
+                waiters, self._sweep_waiters = self._sweep_waiters, []
+            try:
+                if self._watcher_stop.is_set():
+                    break
+                self._sweep()
+            except Exception:
+                logging.exception("Session watcher sweep failed")
+            finally:
+                for waiter in waiters:
+                    waiter.set()
+
+    def _request_sweep(self, timeout: float) -> None:
+        """Wake the watcher for an immediate sweep and wait up to `timeout` for it."""
+        done = threading.Event()
+        with self._sessions_lock:
+            self._sweep_waiters.append(done)
+        self._sweep_now.set()
+        done.wait(timeout)
+
+    def _sweep(self) -> None:
+        with self._sessions_lock:
+            snapshot = dict(self.sessions)
+        if not snapshot:
+            return
+        alive = self._filter_alive(snapshot)
+        if len(alive) == len(snapshot):
+            return
+        dead = {k: p for k, p in snapshot.items() if k not in alive}
+        with self._sessions_lock:
+            # Rebind rather than mutate so readers iterating the old dict are unaffected;
+            # keep entries re-added with a new PID since the snapshot was taken.
+            self.sessions = {k: p for k, p in self.sessions.items() if dead.get(k) != p}
+            self._dirty = True
+
+    def _filter_alive(self, sessions: dict[str, int]) -> dict[str, int]:
+        """Return the subset of `sessions` whose PID is still a running game client."""
+        live = _live_process_names()
+        if live is None:
+            return {k: p for k, p in sessions.items() if self.is_alive(p)}
+        allowed_exes = self._allowed_exes()
+        return {k: p for k, p in sessions.items() if live.get(p) in allowed_exes}
+
+    def cleanup_dead(self, probe: bool = True) -> None:
+        """Prune sessions whose game process has exited and persist the change.
+
+        With probe=True the result is current on return: the watcher (if running)
+        sweeps immediately while the caller waits, otherwise the caller sweeps.
+        probe=False only persists what the last background sweep already pruned.
+        """
+        if self.is_watching():
+            if probe:
+                self._request_sweep(SWEEP_WAIT_TIMEOUT)
+        elif probe:
+            self._sweep()
+        with self._sessions_lock:
+            dirty, self._dirty = self._dirty, False
+        if dirty:
+            self.save()
@@ -26,27 +26,44 @@ class ThemeManager:
             app: Reference to the NWNManagerApp instance
         """
         self.app = app
+        # Palette fingerprint the widgets were last built/recolored with
+        self._applied_fp = None
     
     def apply_theme(self):
-        """Reapply current theme by rebuilding the entire UI."""
+        """Reapply current theme, patching existing widgets where possible."""
+        ui_state_manager = getattr(self.app, 'ui_state_manager', None)
+
         # 1. Update globals in ui_base
+        # Screens are recreated below and the chrome is recolored from its registry,
+        # so skip set_theme's generic repaint walk over the old tree.
         import ui.ui_base as _uib
-        _uib.set_theme(self.app.theme, root=self.app.root)
+        _uib.set_theme(self.app.theme, root=None if ui_state_manager else self.app.root)
+
+        # Same palette as the widgets already wear: nothing to recolor
+        fp = _uib.palette_fingerprint()
+        if fp == self._applied_fp:
+            return
         
-        # 2. Trigger Nuclear Rebuild
-        # This destroys and recreates all widgets with the new theme colors
+        # 2. Recolor persistent widgets in place; fall back to the nuclear rebuild
+        # (destroy and recreate everything) on first build or if patching fails
+        rebuilt = False
         try:
-            if hasattr(self.app, 'ui_state_manager'):
-                self.app.ui_state_manager.rebuild_ui()
+            if ui_state_manager:
+                if not ui_state_manager.retheme_in_place():
+                    # rebuild_ui settles geometry itself while the window is hidden
+                    ui_state_manager.rebuild_ui()
+                    rebuilt = True
+                self._applied_fp = fp
             else:
                 # Fallback if no manager (should not happen in prod)
                 pass
         except Exception as e:
             self.app.log_error("ThemeManager.apply_theme", e)
 
-    # Legacy update methods removed - we now rebuild the world
-
-
-    # Legacy/helper methods removed or folded into _update_tree
-    # Keeping empty stubs if called from outside, or rely on them being internal
+        # 3. Flush all queued geometry/redraw work in a single pass
+        if not rebuilt:
+            try:
+                self.app.root.update_idletasks()
+            except Exception:
+                pass
 
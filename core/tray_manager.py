@@ -17,16 +17,16 @@ except ImportError:
 
 import os
 import sys
+import functools
 
+# PyInstaller creates a temp folder and stores path in _MEIPASS; resolved once at import
+_BASE_PATH = getattr(sys, "_MEIPASS", None) or os.path.abspath(".")
+
+
+@functools.lru_cache(maxsize=32)
 def get_resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_BASE_PATH, relative_path)
 
 
 def create_default_icon(size: int = 64) -> "Image.Image":
@@ -5,10 +5,11 @@ This module centralizes UI initialization, layout helpers, and window controls
 to keep NWNManagerApp focused on wiring and delegating.
 """
 
+import time
 import tkinter as tk
 from tkinter import ttk
 
-from ui.ui_base import COLORS
+from ui.ui_base import COLORS, register_themed, has_themed_widgets, apply_registered_theme
 from ui.components import TitleBar, StatusBar, NavigationBar
 from ui.screens import (
     build_home_screen,
@@ -17,6 +18,46 @@ from ui.screens import (
     build_hotkeys_screen,
     build_spy_screen,
 )
+try:
+    from utils.win_automation import (
+        user32,
+        get_dpi_scale,
+        GWL_EXSTYLE,
+        WS_EX_APPWINDOW,
+        WS_EX_TOOLWINDOW,
+        SW_MINIMIZE,
+    )
+except Exception:
+    # Non-Windows: no Win32 window tweaks, plain Tk behaviour
+    user32 = None
+    get_dpi_scale = None
+    GWL_EXSTYLE = -20
+    WS_EX_APPWINDOW = 0x00040000
+    WS_EX_TOOLWINDOW = 0x00000080
+    SW_MINIMIZE = 6
+from core.constants import (
+    STATUS_BAR_FAST_INTERVAL_MS,
+    STATUS_BAR_IDLE_INTERVAL_MS,
+    STATUS_BAR_ACTIVE_WINDOW_SECONDS,
+    STATUS_BAR_SUSPEND_GAP_SECONDS,
+    RESIZE_DEBOUNCE_MS,
+    COMPACT_LAYOUT_THRESHOLD_WIDTH,
+)
+
+
+# (bg, fg) COLORS keys for nav buttons, indexed by "is active screen"
+_NAV_BTN_STYLE_KEYS = {
+    True: ("accent", "text_dark"),
+    False: ("bg_panel", "fg_text"),
+}
+
+# Option-database patterns for the Combobox dropdown and the COLORS key each takes
+_LISTBOX_OPTIONS = (
+    ("*TCombobox*Listbox.background", "bg_input"),
+    ("*TCombobox*Listbox.foreground", "fg_text"),
+    ("*TCombobox*Listbox.selectBackground", "accent"),
+    ("*TCombobox*Listbox.selectForeground", "text_dark"),
+)
 
 
 class UIStateManager:
@@ -24,27 +65,34 @@ class UIStateManager:
 
     def __init__(self, app):
         self.app = app
+        # Pending debounced layout check and last (widget, pad) applied by update_spacing
+        self._resize_after_id = None
+        self._last_spacing = None
+        # Screen frame currently raised in content_frame (see show_screen)
+        self._visible_screen = None
+        # Screens whose builder is currently running (guards against re-entrant show_screen)
+        self._building = set()
+        # (dpi_scale, screen_width, screen_height), see get_window_metrics()
+        self._window_metrics = None
+        # Status bar scheduler state: a self-rescheduling root.after chain whose
+        # delay adapts between the fast and idle intervals
+        self._status_after_id = None
+        self._status_delay_ms = STATUS_BAR_FAST_INTERVAL_MS
+        self._status_dirty = True
+        self._status_signature = None
+        self._last_status_tick = 0.0
+        self._last_status_change = 0.0
 
     def configure_root_window(self):
         root = self.app.root
         root.title("16:09 Launcher")
 
-        # Get DPI scale factor for HiDPI displays (4K, etc.)
-        try:
-            from utils.win_automation import get_dpi_scale
-            dpi_scale = get_dpi_scale()
-        except Exception:
-            dpi_scale = 1.0
-        
-        # Clamp scale to reasonable range (1.0 - 3.0)
-        dpi_scale = max(1.0, min(3.0, dpi_scale))
+        # DPI scale factor for HiDPI displays (4K, etc.) and screen dimensions
+        dpi_scale, sw, sh = self.get_window_metrics()
         
         # Store for later use
         self.app.dpi_scale = dpi_scale
         
-        # Get screen dimensions
-        sw, sh = root.winfo_screenwidth(), root.winfo_screenheight()
-        
         # Percentage-based sizing relative to screen resolution
         width = int(sw * 0.66)
         height = int(sh * 0.65)
@@ -67,6 +115,31 @@ class UIStateManager:
         
         print(f"[Window] Screen: {sw}x{sh}, DPI: {dpi_scale}, Window: {width}x{height}")
 
+    def get_window_metrics(self):
+        """Return (dpi_scale, screen_width, screen_height), cached until the
+        window moves to another monitor."""
+        if self._window_metrics is None:
+            root = self.app.root
+            try:
+                dpi_scale = get_dpi_scale() if get_dpi_scale else 1.0
+            except Exception:
+                dpi_scale = 1.0
+            
+            # Clamp scale to reasonable range (1.0 - 3.0)
+            dpi_scale = max(1.0, min(3.0, dpi_scale))
+            self._window_metrics = (dpi_scale, root.winfo_screenwidth(), root.winfo_screenheight())
+        return self._window_metrics
+
+    def _check_monitor_change(self, event):
+        """Drop cached metrics once the window's center leaves the cached screen."""
+        if self._window_metrics is None or event.widget is not self.app.root:
+            return
+        _, sw, sh = self._window_metrics
+        cx = event.x + event.width // 2
+        cy = event.y + event.height // 2
+        if not (0 <= cx < sw and 0 <= cy < sh):
+            self._window_metrics = None
+
     def initialize_state(self):
         """Initialize UI-related state and Tk variables."""
         self.app.doc_path_var = tk.StringVar()
@@ -97,7 +170,6 @@ class UIStateManager:
 
         self.app.view_map = []
         self.app.drag_data = {"index": None}
-        self.app._drag_data = {"x": 0, "y": 0}
 
         # UI components
         self.app.title_bar_comp = None
@@ -120,91 +192,100 @@ class UIStateManager:
         style = ttk.Style()
         style.theme_use("clam")
 
-        style.configure(
-            "TCheckbutton",
-            background=COLORS["bg_root"],
-            foreground=COLORS["fg_text"],
-            font=("Segoe UI", 10),
-            focuscolor=COLORS["bg_root"],
-        )
-
-        style.map(
-            "TCombobox",
-            fieldbackground=[("readonly", COLORS["bg_input"])],
-            selectbackground=[("readonly", COLORS["bg_input"])],
-            selectforeground=[("readonly", COLORS["fg_text"])],
-            background=[("readonly", COLORS["bg_panel"])],
-        )
-
-        style.configure(
-            "TCombobox",
-            background=COLORS["bg_panel"],
-            foreground=COLORS["fg_text"],
-            fieldbackground=COLORS["bg_input"],
-            arrowcolor=COLORS["fg_text"],
-            bordercolor=COLORS["border"],
-        )
+        accent = COLORS["accent"]
+        bg_input = COLORS["bg_input"]
+        bg_panel = COLORS["bg_panel"]
+        bg_root = COLORS["bg_root"]
+        border = COLORS["border"]
+        fg_dim = COLORS["fg_dim"]
+        fg_text = COLORS["fg_text"]
+        text_dark = COLORS["text_dark"]
+
+        # All ttk style configure/map/layout calls go to Tcl as one
+        # "ttk::style theme settings" script instead of one round-trip each.
+        style.theme_settings("clam", {
+            "TCheckbutton": {
+                "configure": {
+                    "background": bg_root,
+                    "foreground": fg_text,
+                    "font": ("Segoe UI", 10),
+                    "focuscolor": bg_root,
+                },
+            },
+            "TCombobox": {
+                "map": {
+                    "fieldbackground": [("readonly", bg_input)],
+                    "selectbackground": [("readonly", bg_input)],
+                    "selectforeground": [("readonly", fg_text)],
+                    "background": [("readonly", bg_panel)],
+                },
+                "configure": {
+                    "background": bg_panel,
+                    "foreground": fg_text,
+                    "fieldbackground": bg_input,
+                    "arrowcolor": fg_text,
+                    "bordercolor": border,
+                },
+            },
+            # Treeview Styles
+            "ProfileList.Treeview": {
+                "configure": {
+                    "background": bg_panel,
+                    "foreground": fg_text,
+                    "fieldbackground": bg_panel,
+                    "borderwidth": 0,
+                    "font": ("Segoe UI", 11),
+                    "rowheight": 28,
+                },
+                "map": {
+                    "background": [
+                        ("selected", "focus", accent),
+                        ("selected", "!focus", accent),
+                        ("!selected", bg_panel),
+                    ],
+                    "foreground": [
+                        ("selected", "focus", text_dark),
+                        ("selected", "!focus", text_dark),
+                        ("!selected", fg_text),
+                    ],
+                },
+                # Remove default border from Treeview layout
+                "layout": [("ProfileList.Treeview.treearea", {"sticky": "nswe"})],
+            },
+            "ProfileList.Treeview.Heading": {
+                "configure": {
+                    "background": bg_panel,
+                    "foreground": fg_dim,
+                    "font": ("Segoe UI", 9, "bold"),
+                    "relief": "flat",
+                },
+                "map": {
+                    "background": [("active", bg_panel)],
+                    "foreground": [("active", accent)],
+                },
+            },
+            # Add visual separation between items (borders)
+            "ProfileList.Treeview.Item": {
+                "configure": {
+                    "borderwidth": 1,
+                    "bordercolor": border,  # Use distinct border color as separator
+                    "relief": "solid",
+                },
+                "map": {
+                    "bordercolor": [("selected", accent)],
+                },
+            },
+        })
         
         # Style the dropdown list (Listbox) for Combobox - ttk.Style doesn't affect it
-        self.app.root.option_add("*TCombobox*Listbox.background", COLORS["bg_input"])
-        self.app.root.option_add("*TCombobox*Listbox.foreground", COLORS["fg_text"])
-        self.app.root.option_add("*TCombobox*Listbox.selectBackground", COLORS["accent"])
-        self.app.root.option_add("*TCombobox*Listbox.selectForeground", COLORS["text_dark"])
-
-        # Treeview Styles
-        style.configure(
-            "ProfileList.Treeview",
-            background=COLORS["bg_panel"],
-            foreground=COLORS["fg_text"],
-            fieldbackground=COLORS["bg_panel"],
-            borderwidth=0,
-            font=("Segoe UI", 11),
-            rowheight=28
-        )
-        style.map(
-            "ProfileList.Treeview",
-            background=[
-                ("selected", "focus", COLORS["accent"]),
-                ("selected", "!focus", COLORS["accent"]),
-                ("!selected", COLORS["bg_panel"])
-            ],
-            foreground=[
-                ("selected", "focus", COLORS["text_dark"]),
-                ("selected", "!focus", COLORS["text_dark"]),
-                ("!selected", COLORS["fg_text"])
-            ]
-        )
-        style.configure(
-            "ProfileList.Treeview.Heading",
-            background=COLORS["bg_panel"],
-            foreground=COLORS["fg_dim"],
-            font=("Segoe UI", 9, "bold"),
-            relief="flat"
-        )
-        style.map("ProfileList.Treeview.Heading",
-            background=[("active", COLORS["bg_panel"])],
-            foreground=[("active", COLORS["accent"])]
-        )
-        
-        
-        # Remove default border from Treeview layout
-        style.layout("ProfileList.Treeview", [('ProfileList.Treeview.treearea', {'sticky': 'nswe'})])
-
-        # Add visual separation between items (borders)
-        style.configure(
-            "ProfileList.Treeview.Item",
-            borderwidth=1,
-            bordercolor=COLORS["border"], # Use distinct border color as separator
-            relief="solid"
-        )
-        style.map(
-            "ProfileList.Treeview.Item",
-            bordercolor=[("selected", COLORS["accent"])]
-        )
+        # (sent as one Tcl script rather than one option_add round-trip per key)
+        self.app.root.tk.eval("\n".join(
+            f"option add {{{pattern}}} {{{COLORS[key]}}}" for pattern, key in _LISTBOX_OPTIONS
+        ))
 
     def set_appwindow(self):
-        from utils.win_automation import user32, GWL_EXSTYLE, WS_EX_APPWINDOW, WS_EX_TOOLWINDOW
-
+        if user32 is None:
+            return
         try:
             hwnd = user32.GetParent(self.app.root.winfo_id())
             style = user32.GetWindowLongW(hwnd, GWL_EXSTYLE)
@@ -216,18 +297,10 @@ class UIStateManager:
         except Exception as e:
             self.app.log_error("set_appwindow", e)
 
-    def start_move(self, event):
-        self.app._drag_data["x"] = event.x
-        self.app._drag_data["y"] = event.y
-
-    def do_move(self, event):
-        x = self.app.root.winfo_x() + (event.x - self.app._drag_data["x"])
-        y = self.app.root.winfo_y() + (event.y - self.app._drag_data["y"])
-        self.app.root.geometry(f"+{x}+{y}")
-
     def minimize_window(self):
-        from utils.win_automation import user32, SW_MINIMIZE
-
+        if user32 is None:
+            self.app.root.iconify()
+            return
         try:
             hwnd = user32.GetParent(self.app.root.winfo_id())
             user32.ShowWindow(hwnd, SW_MINIMIZE)
@@ -248,6 +321,7 @@ class UIStateManager:
     def create_ui(self):
         """Build main UI layout."""
         app = self.app
+        bg_root = COLORS["bg_root"]
         # Title bar
         app.title_bar_comp = TitleBar(app, app.root)
 
@@ -256,18 +330,18 @@ class UIStateManager:
         app.status_bar_comp = StatusBar(app, app.root)
 
         # Main container (kept between title bar and status bar)
-        main_container = tk.Frame(app.root, bg=COLORS["bg_root"])
+        main_container = register_themed(tk.Frame(app.root, bg=bg_root), bg="bg_root")
         main_container.pack(side="top", fill="both", expand=True)
 
         # Navigation bar at top
-        app.nav_frame = tk.Frame(main_container, bg=COLORS["bg_panel"], height=60)
+        app.nav_frame = register_themed(tk.Frame(main_container, bg=COLORS["bg_panel"], height=60), bg="bg_panel")
         app.nav_frame.pack(fill="x", side="top")
         app.nav_frame.pack_propagate(False)
 
         app.nav_bar_comp = NavigationBar(app, app.nav_frame)
 
         # Content area
-        app.content_frame = tk.Frame(main_container, bg=COLORS["bg_root"])
+        app.content_frame = register_themed(tk.Frame(main_container, bg=bg_root), bg="bg_root")
         app.content_frame.pack(fill="both", expand=True)
 
         # Create home screen immediately (most used), others loaded lazily
@@ -276,8 +350,50 @@ class UIStateManager:
         # Show home by default
         self.show_screen("home")
 
-        # Start status bar update loop
+        # Refresh the status bar now; the scheduler survives rebuilds and is started once
+        self._status_dirty = True
         self._update_status_bar_loop()
+        self._start_status_scheduler()
+
+    def retheme_in_place(self) -> bool:
+        """Recolor the persistent chrome in place and rebuild only the screens.
+
+        Title, status and navigation bars plus registered containers are
+        reconfigured from the current COLORS; screens (built from COLORS at
+        construction time) are recreated, non-visible ones lazily on next visit.
+        Returns False when there is nothing to patch yet, so the caller can fall
+        back to rebuild_ui().
+        """
+        app = self.app
+        if not has_themed_widgets() or app.status_bar_comp is None:
+            return False
+        try:
+            current_screen = app.current_screen
+
+            self.setup_styles()
+            app.root.configure(bg=COLORS["bg_root"])
+            apply_registered_theme()
+            for comp in (app.title_bar_comp, app.nav_bar_comp, app.status_bar_comp):
+                if comp:
+                    comp.apply_theme()
+
+            for screen in app.screens.values():
+                screen.destroy()
+            app.screens = {}
+            self._visible_screen = None
+
+            # Home is always present (profile list refresh below depends on it)
+            self.create_home_screen()
+            self.show_screen(current_screen)
+
+            if hasattr(app, 'profile_manager'):
+                app.profile_manager.refresh_list()
+            if hasattr(app, '_create_server_buttons'):
+                app._create_server_buttons()
+            return True
+        except Exception as e:
+            app.log_error("retheme_in_place", e)
+            return False
 
     def rebuild_ui(self):
         """Destroy all window content and rebuild from scratch.
@@ -285,13 +401,22 @@ class UIStateManager:
         This is the nuclear option for theme application. Instead of trying to patch
         colors on existing widgets (which is error-prone), we wipe the slate clean
         and build everything fresh with the new theme globals.
+
+        The window is made fully transparent while the tree is rebuilt so the
+        half-built intermediate states are never painted. Alpha is used rather
+        than wm_withdraw because the root is an overrideredirect window.
         """
+        root = self.app.root
+        try:
+            root.attributes("-alpha", 0.0)
+        except tk.TclError:
+            pass
         try:
             # 1. Save state
             current_screen = self.app.current_screen
             
             # 2. Destroy all widgets in root
-            for widget in self.app.root.winfo_children():
+            for widget in root.winfo_children():
                 widget.destroy()
                 
             # 3. Reset component references
@@ -301,10 +426,11 @@ class UIStateManager:
             self.app.nav_frame = None
             self.app.content_frame = None
             self.app.screens = {}
+            self._visible_screen = None
             
             # 4. Re-apply ttk styles with new COLORS
             self.setup_styles()
-            self.app.root.configure(bg=COLORS["bg_root"])
+            root.configure(bg=COLORS["bg_root"])
             
             # 5. Re-create UI
             # This uses the CURRENT global COLORS (which should have been updated by set_theme)
@@ -319,27 +445,88 @@ class UIStateManager:
             if hasattr(self.app, '_create_server_buttons'):
                 self.app._create_server_buttons()
             
-            # 8. Force immediate update
-            self.app.root.update_idletasks()
+            # 8. Settle geometry while still hidden so the window reappears complete
+            root.update_idletasks()
             
         except Exception as e:
             self.app.log_error("rebuild_ui", e)
+        finally:
+            try:
+                root.attributes("-alpha", 1.0)
+            except tk.TclError:
+                pass
     
-    def _update_status_bar_loop(self):
-        """Periodically update status bar information."""
+    def mark_status_dirty(self):
+        """Request a status/nav refresh on the next tick and switch to the fast interval."""
+        self._status_dirty = True
+
+    def _start_status_scheduler(self):
+        """Start the status bar tick chain; it survives rebuilds, so only once."""
+        if self._status_after_id is None:
+            self._schedule_status_tick()
+
+    def _schedule_status_tick(self):
         try:
-            self._update_status_bar()
-        except Exception:
-            pass
-        self.app.root.after(1000, self._update_status_bar_loop)
+            self._status_after_id = self.app.root.after(self._status_delay_ms, self._status_tick)
+        except tk.TclError:
+            # Root window destroyed
+            self._status_after_id = None
+
+    def _status_tick(self):
+        self._update_status_bar_loop()
+        self._schedule_status_tick()
 
-    def _update_status_bar(self):
-        """Update all status bar labels."""
+    def _update_status_bar_loop(self):
+        """Update status bar information; called on the Tk thread by _status_tick.
+
+        Ticks every STATUS_BAR_FAST_INTERVAL_MS for a few seconds after a change and
+        every STATUS_BAR_IDLE_INTERVAL_MS otherwise. Fast ticks only refresh when
+        something changed; idle ticks always refresh so focus-dependent text stays
+        current. The first tick after a suspend/resume gap is skipped.
+        """
+        now = time.monotonic()
+        gap = now - self._last_status_tick if self._last_status_tick else 0.0
+        self._last_status_tick = now
+        if gap < STATUS_BAR_SUSPEND_GAP_SECONDS:
+            try:
+                changed, log_on = self._consume_status_change()
+                if changed:
+                    self._last_status_change = now
+                recent = now - self._last_status_change < STATUS_BAR_ACTIVE_WINDOW_SECONDS
+                if changed or not recent:
+                    # Reuse this tick's is_running() result from the change check
+                    self._update_status_bar(log_on=log_on)
+            except Exception:
+                pass
+        recent = now - self._last_status_change < STATUS_BAR_ACTIVE_WINDOW_SECONDS
+        self._status_delay_ms = STATUS_BAR_FAST_INTERVAL_MS if recent else STATUS_BAR_IDLE_INTERVAL_MS
+
+    def _consume_status_change(self) -> tuple[bool, bool]:
+        """Return (needs refresh since the last tick, log monitor running)."""
+        app = self.app
+        monitor = app.log_monitor_state.monitor
+        log_on = bool(monitor and monitor.is_running())
+        signature = (app.sessions.count, log_on)
+        changed = self._status_dirty or signature != self._status_signature
+        self._status_dirty = False
+        self._status_signature = signature
+        return changed, log_on
+
+    def _update_status_bar(self, log_on=None):
+        """Update all status bar labels.
+
+        `log_on` is the log monitor's running state if the caller already has it,
+        so the status bar and nav bar share one is_running() check per tick.
+        """
+        if log_on is None:
+            monitor = self.app.log_monitor_state.monitor
+            log_on = bool(monitor and monitor.is_running())
+        # Tk's idle loop coalesces the redraws these writes queue; no forced flush
         if self.app.status_bar_comp:
-            self.app.status_bar_comp.update()
+            self.app.status_bar_comp.update(log_on)
 
         # Update navigation indicators
-        self._update_nav_indicators()
+        self._update_nav_indicators(log_on)
 
         # Update slayer UI state periodically
         try:
@@ -347,47 +534,46 @@ class UIStateManager:
         except Exception:
             pass
 
-    def _update_nav_indicators(self):
+    def _update_nav_indicators(self, log_on=None):
         """Update navigation button indicators."""
         if self.app.nav_bar_comp:
-            self.app.nav_bar_comp.update_indicators()
+            self.app.nav_bar_comp.update_indicators(log_on)
 
     def _update_nav_btn_style(self, btn, screen_name):
         """Update button style based on whether it's the active screen."""
-        if screen_name == self.app.current_screen:
-            btn.configure(bg=COLORS["accent"], fg=COLORS["text_dark"])
-        else:
-            btn.configure(bg=COLORS["bg_panel"], fg=COLORS["fg_text"])
+        bg, fg = _NAV_BTN_STYLE_KEYS[screen_name == self.app.current_screen]
+        btn.configure(bg=COLORS[bg], fg=COLORS[fg])
 
     def show_screen(self, screen_name):
         """Switch to specified screen instantly. Lazily creates screen if needed."""
         # Lazy-load screen if not yet created
         if screen_name not in self.app.screens:
+            if screen_name in self._building:
+                return
             builder_name = self._SCREEN_BUILDERS.get(screen_name)
             if builder_name:
                 builder_method = getattr(self, builder_name, None)
                 if builder_method:
-                    builder_method()
+                    self._building.add(screen_name)
+                    try:
+                        builder_method()
+                    finally:
+                        self._building.discard(screen_name)
             # If still not created, bail
             if screen_name not in self.app.screens:
                 return
         
         new_screen = self.app.screens.get(screen_name)
         
-        # Hide all other screens
-        for name, screen in self.app.screens.items():
-            if name != screen_name:
-                try:
-                    screen.pack_forget()
-                except Exception:
-                    pass
-        
         # Skip if same screen and already visible
-        try:
-            if screen_name == self.app.current_screen and new_screen.winfo_ismapped():
-                return
-        except Exception:
-            pass
+        if new_screen is self._visible_screen:
+            return
+        
+        # Screens are stacked in the same cell of content_frame; each is placed
+        # once on first show and switching is just a raise.
+        if not new_screen.winfo_manager():
+            new_screen.place(x=0, y=0, relwidth=1, relheight=1)
+        self._visible_screen = new_screen
         
         # Update state
         self.app.current_screen = screen_name
@@ -398,20 +584,33 @@ class UIStateManager:
                 self.app.nav_bar_comp._update_style(name)
         
         # Show new screen
-        new_screen.pack(fill="both", expand=True)
+        new_screen.tkraise()
 
     def create_home_screen(self):
         """Original main UI as home screen (delegated)."""
         return build_home_screen(self.app)
 
     def on_root_resize(self, event):
-        """Listen to root size changes and switch layout mode when crossing threshold."""
+        """Listen to root size changes and switch layout mode when crossing threshold.
+
+        <Configure> fires continuously during a drag-resize, so the layout check
+        is debounced until events settle for RESIZE_DEBOUNCE_MS.
+        """
+        self._check_monitor_change(event)
+        if self._resize_after_id:
+            try:
+                self.app.root.after_cancel(self._resize_after_id)
+            except Exception:
+                pass
+        self._resize_after_id = self.app.root.after(RESIZE_DEBOUNCE_MS, self._apply_resize)
+
+    def _apply_resize(self):
+        self._resize_after_id = None
         try:
             width = self.app.root.winfo_width()
         except Exception:
             return
-        threshold = 900
-        mode = "wide" if width >= threshold else "compact"
+        mode = "wide" if width >= COMPACT_LAYOUT_THRESHOLD_WIDTH else "compact"
         if mode == getattr(self.app, "_layout_mode", None):
             return
         self.apply_layout_mode(mode)
@@ -432,8 +631,13 @@ class UIStateManager:
             base = 18 if mode == "compact" else 32
             pad = int(base + 24 * scale)
             if hasattr(self.app, "home_content"):
+                # Skip pack_configure when this widget already has this padding
+                applied = (self.app.home_content, pad)
+                if applied == self._last_spacing:
+                    return
                 try:
                     self.app.home_content.pack_configure(padx=pad, pady=pad)
+                    self._last_spacing = applied
                 except Exception:
                     pass
         except Exception as e:
@@ -1,15 +1,30 @@
 import sys
 import os
+import time
+import importlib
 
-print(f"CWD: {os.getcwd()}")
-print(f"Sys Path: {sys.path}")
-
-try:
-    import core
-    print(f"Core imported: {core}")
-    from core import log_monitor_manager
-    print(f"LogMonitorManager imported: {log_monitor_manager}")
-except ImportError as e:
-    print(f"Import Error: {e}")
-except Exception as e:
-    print(f"Other Error: {e}")
+
+MODULES = (
+    "core",
+    "core.log_monitor_manager",
+)
+
+
+def main():
+    print(f"CWD: {os.getcwd()}")
+    print(f"Sys Path: {sys.path}")
+
+    for name in MODULES:
+        try:
+            start = time.perf_counter()
+            module = importlib.import_module(name)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print(f"Imported {name} in {elapsed_ms:.1f} ms: {module}")
+        except ImportError as e:
+            print(f"Import Error ({name}): {e}")
+        except Exception as e:
+            print(f"Other Error ({name}): {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import sys
+import types
+import ctypes
+from types import MappingProxyType
+from pathlib import Path
+from unittest.mock import Mock
+
+# Make the project root importable (core/, ui/, utils/) for all test modules
+_ROOT = str(Path(__file__).resolve().parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+# We need to stub tkinter before importing app modules to avoid "TclError: no display name"
+# in headless environments. tkinter and its submodules are plain module shims sharing one tree
+# (so `from tkinter import ttk` finds the same object as sys.modules['tkinter.ttk']); widget and
+# variable names are placeholder classes because app modules subclass tk.Frame/Toplevel at import.
+# ui_base imports tkinter too, and modules like profile_manager.py do `from ui_base import COLORS`,
+# so the mocked ui_base must carry COLORS (read-only, so no test can leak a change into another).
+# Installed once at conftest import, before any test module is collected.
+_TK_CLASS_NAMES = (
+    'Tk', 'Toplevel', 'Widget', 'Frame', 'LabelFrame', 'Label', 'Button', 'Listbox',
+    'StringVar', 'IntVar', 'BooleanVar',
+)
+
+_tk = types.ModuleType('tkinter')
+for _name in _TK_CLASS_NAMES:
+    setattr(_tk, _name, type(_name, (object,), {}))
+for _sub in ('ttk', 'messagebox', 'filedialog'):
+    setattr(_tk, _sub, types.ModuleType(f'tkinter.{_sub}'))
+
+# Windows-only ctypes entry points: core.storage and utils.win_automation build their
+# Win32 function prototypes at import time. On other platforms every prototype becomes a
+# Mock so the modules import; tests never call into them.
+if not hasattr(ctypes, 'windll'):
+    ctypes.windll = Mock()
+    ctypes.WINFUNCTYPE = lambda *args, **kwargs: Mock()
+
+_mock_ui_base = Mock()
+_mock_ui_base.COLORS = MappingProxyType({"bg_sidebar": "black", "fg_dim": "gray", "success": "green", "accent": "blue", "fg_text": "white", "danger": "red"})
+
+sys.modules.update({
+    'tkinter': _tk,
+    'tkinter.ttk': _tk.ttk,
+    'tkinter.messagebox': _tk.messagebox,
+    'tkinter.filedialog': _tk.filedialog,
+    'ui_base': _mock_ui_base,
+    'dialogs': Mock(),
+})
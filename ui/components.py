@@ -1,7 +1,20 @@
 import tkinter as tk
 from tkinter import ttk
 import os
-from ui.ui_base import COLORS, TitleBarButton
+import re
+import time
+import logging
+from ui.ui_base import COLORS, TitleBarButton, register_themed, palette_fingerprint
+from core.constants import DRAG_FRAME_INTERVAL_MS, STATUS_TOGGLE_DEBOUNCE_SECONDS
+
+try:
+    from utils.win_automation import user32, WM_NCLBUTTONDOWN, HTCAPTION
+except Exception:
+    # Non-Windows: title bar falls back to the Tk motion-event drag
+    user32 = None
+
+# Width and height from a Tk geometry string ("WxH+X+Y")
+_GEOMETRY_SIZE_RE = re.compile(r"(\d+)x(\d+)")
 
 class TitleBar:
     def __init__(self, app, parent):
@@ -11,6 +24,15 @@ class TitleBar:
         self._drag_data = {"x": 0, "y": 0}
         self._is_maximized = False
         self._normal_geometry = None
+        # Palette the widgets were last colored with, see apply_theme
+        self._palette_fp = palette_fingerprint()
+        # Fallback drag state (see do_move): motion events only record the target,
+        # and the latest position is applied at most once per DRAG_FRAME_INTERVAL_MS.
+        self._pending_move = None
+        self._move_scheduled = False
+        # Drag flushes call `wm geometry` directly, skipping Wm.geometry's wrapper
+        self._tk_call = self.root.tk.call
+        self._root_path = self.root._w
         
         self.frame = tk.Frame(
             self.parent,
@@ -22,9 +44,6 @@ class TitleBar:
         self.frame.pack(fill="x", side="top")
         self.frame.pack_propagate(False)
 
-        self.frame.bind("<Button-1>", self.start_move)
-        self.frame.bind("<B1-Motion>", self.do_move)
-        self.frame.bind("<Double-Button-1>", lambda e: self.toggle_maximize())
 
         self.title_lbl = tk.Label(
             self.frame,
@@ -34,9 +53,14 @@ class TitleBar:
             font=("Segoe UI", 10, "bold"),
         )
         self.title_lbl.pack(side="left", padx=15)
-        self.title_lbl.bind("<Button-1>", self.start_move)
-        self.title_lbl.bind("<B1-Motion>", self.do_move)
-        self.title_lbl.bind("<Double-Button-1>", lambda e: self.toggle_maximize())
+
+        # Frame and title label share one "TitleBarDrag" bindtag, so the drag and
+        # double-click handlers are registered once for both
+        for widget in (self.frame, self.title_lbl):
+            widget.bindtags(("TitleBarDrag",) + widget.bindtags())
+        self.frame.bind_class("TitleBarDrag", "<Button-1>", self.start_move)
+        self.frame.bind_class("TitleBarDrag", "<B1-Motion>", self.do_move)
+        self.frame.bind_class("TitleBarDrag", "<Double-Button-1>", lambda e: self.toggle_maximize())
 
         # Buttons are packed from right to left: Close -> Maximize -> Minimize
         # Using Segoe Fluent Icons: E8BB = Close, E922/E923 = Maximize/Restore, E921 = Minimize
@@ -53,17 +77,18 @@ class TitleBar:
 
     def toggle_maximize(self):
         """Toggle between maximized and normal window state."""
-        sw = self.root.winfo_screenwidth()
-        sh = self.root.winfo_screenheight()
+        # Screen size is cached by UIStateManager and dropped when the window
+        # moves to another monitor (root <Configure>)
+        _, sw, sh = self.app.ui_state_manager.get_window_metrics()
         
         if self._is_maximized:
             # Restore to normal size and center
             if self._normal_geometry:
                 # Parse saved geometry "WxH+X+Y"
-                try:
-                    size_part = self._normal_geometry.split('+')[0]
-                    w, h = map(int, size_part.split('x'))
-                except:
+                m = _GEOMETRY_SIZE_RE.match(self._normal_geometry)
+                if m:
+                    w, h = int(m.group(1)), int(m.group(2))
+                else:
                     w, h = max(900, min(int(sw * 0.55), 1600)), max(500, min(int(sh * 0.65), 1000))
                 
                 # Center on screen
@@ -81,24 +106,76 @@ class TitleBar:
             self._is_maximized = True
 
     def start_move(self, event):
-        self._drag_data["x"] = event.x
-        self._drag_data["y"] = event.y
+        # Pointer offset from the window origin; do_move then works from the
+        # event's screen coordinates alone, with no winfo_x/y query per motion
+        self._drag_data["x"] = event.x_root - self.root.winfo_x()
+        self._drag_data["y"] = event.y_root - self.root.winfo_y()
+        # Hand the drag to the OS move loop; do_move only runs if that fails
+        # (or while maximized, where dragging restores the window first).
+        if not self._is_maximized:
+            self._begin_native_drag()
+
+    def _begin_native_drag(self) -> bool:
+        """Start a native caption drag, as if the press landed on a real title bar.
+
+        Windows then runs the move loop itself, so no <B1-Motion> events reach
+        Python for the duration of the drag.
+        """
+        if user32 is None:
+            return False
+        try:
+            hwnd = user32.GetParent(self.root.winfo_id())
+            if not hwnd:
+                return False
+            user32.ReleaseCapture()
+            user32.SendMessageW(hwnd, WM_NCLBUTTONDOWN, HTCAPTION, 0)
+            return True
+        except Exception:
+            return False
 
     def do_move(self, event):
+        """Fallback drag for when the native caption drag isn't in charge.
+
+        On Windows start_move hands normal drags to the OS move loop, so this only
+        runs for a drag that starts maximized (restore, then follow the pointer),
+        when the native call fails, or on platforms without user32. Moves are
+        throttled to one per DRAG_FRAME_INTERVAL_MS via _flush_move.
+        """
         # If maximized, exit maximize mode on drag
         if self._is_maximized:
             self.toggle_maximize()
+            # The restored window is re-centered; continue the drag from the
+            # pointer's offset into the restored window, as start_move records it
+            self._drag_data["x"] = event.x_root - self.root.winfo_rootx()
+            self._drag_data["y"] = event.y_root - self.root.winfo_rooty()
             return
-        x = self.root.winfo_x() + (event.x - self._drag_data["x"])
-        y = self.root.winfo_y() + (event.y - self._drag_data["y"])
-        self.root.geometry(f"+{x}+{y}")
+        x = event.x_root - self._drag_data["x"]
+        y = event.y_root - self._drag_data["y"]
+        self._pending_move = (x, y)
+        if not self._move_scheduled:
+            self._move_scheduled = True
+            self.root.after(DRAG_FRAME_INTERVAL_MS, self._flush_move)
+
+    def _flush_move(self):
+        """Apply the most recent drag target recorded by do_move."""
+        self._move_scheduled = False
+        pos = self._pending_move
+        if pos is None:
+            return
+        self._pending_move = None
+        self._tk_call("wm", "geometry", self._root_path, f"+{pos[0]}+{pos[1]}")
 
     def apply_theme(self):
         """Update colors for theme switch."""
+        fp = palette_fingerprint()
+        if fp == self._palette_fp:
+            return
+        self._palette_fp = fp
         try:
             self.frame.config(bg=COLORS["bg_panel"])
             self.title_lbl.config(bg=COLORS["bg_panel"], fg=COLORS["fg_text"])
             self.close_btn.update_colors()
+            self.close_btn.hover_color = COLORS["danger"]
             self.max_btn.update_colors()
             self.min_btn.update_colors()
         except Exception:
@@ -106,11 +183,33 @@ class TitleBar:
 
 
 class StatusBar:
+    # COLORS keys a status entry's state can take. Each gets a shared ttk style for
+    # the text and for the icon, so a state change is a style swap and a theme
+    # switch reconfigures the styles rather than every label.
+    _STATE_ROLES = ("success", "accent", "warning", "fg_dim")
+    _TEXT_STYLES = {role: f"Status.{role}.TLabel" for role in _STATE_ROLES}
+    _ICON_STYLES = {role: f"StatusIcon.{role}.TLabel" for role in _STATE_ROLES}
+
     def __init__(self, app, parent):
         self.app = app
         self.parent = parent
         self.labels = {}
+        # Palette the widgets were last colored with, see apply_theme
+        self._palette_fp = palette_fingerprint()
+        # Last (text, state role) written to each status label by update(), see _set_label
+        self._label_state = {}
+        # True while a request_update() flush is queued on the Tk idle queue
+        self._update_dirty = False
+        # Enabled hotkey bind count, recomputed lazily after invalidate_hotkey_count()
+        self._hk_binds_count = None
+        # toggle name -> time.monotonic() of the last accepted click, see _debounce_toggle
+        self._toggle_debounce = {}
         self._resize_data = {"x": 0, "y": 0, "width": 0, "height": 0}
+        # Latest (width, height) from the grip drag, applied once per DRAG_FRAME_INTERVAL_MS
+        self._resize_pending = None
+        self._resize_scheduled = False
+        
+        self._configure_status_styles()
         
         self.frame = tk.Frame(self.parent, bg=COLORS["bg_panel"], height=28)
         self.frame.pack(fill="x", side="bottom")
@@ -130,7 +229,7 @@ class StatusBar:
         self.resize_grip.bind("<B1-Motion>", self._do_resize)
         
         # Save State button (Right-aligned, before resize grip)
-        self.save_frame = tk.Frame(self.frame, bg=COLORS["bg_panel"], cursor="hand2")
+        self.save_frame = register_themed(tk.Frame(self.frame, bg=COLORS["bg_panel"], cursor="hand2"), bg="bg_panel")
         self.save_frame.pack(side="right", padx=(10, 5), pady=4)
         
         self._save_icon = tk.Label(
@@ -138,8 +237,7 @@ class StatusBar:
             text="\uE74E",  # Save icon (Floppy disk) in Segoe Fluent
             bg=COLORS["bg_panel"],
             fg=COLORS["accent"],
-            font=("Segoe Fluent Icons", 11),
-            cursor="hand2"
+            font=("Segoe Fluent Icons", 11)
         )
         self._save_icon.pack(side="left")
         
@@ -148,8 +246,7 @@ class StatusBar:
             text="Save State",
             bg=COLORS["bg_panel"],
             fg=COLORS["fg_text"],
-            font=("Segoe UI", 9, "bold"),
-            cursor="hand2"
+            font=("Segoe UI", 9, "bold")
         )
         self.labels["save_state"].pack(side="left", padx=(3, 0))
         
@@ -174,73 +271,68 @@ class StatusBar:
                 self._save_icon.config(fg=COLORS["danger"])
                 print(f"[StatusBar] Save Error: {ex}")
                 
-        self.save_frame.bind("<Button-1>", _trigger_save)
-        self._save_icon.bind("<Button-1>", _trigger_save)
-        self.labels["save_state"].bind("<Button-1>", _trigger_save)
+        self._bind_click("StatusSave", _trigger_save, self.save_frame, self._save_icon, self.labels["save_state"])
         
         # Left side: Sessions count - split into icon + text for proper font rendering
-        left_frame = tk.Frame(self.frame, bg=COLORS["bg_panel"])
+        left_frame = register_themed(tk.Frame(self.frame, bg=COLORS["bg_panel"]), bg="bg_panel")
         left_frame.pack(side="left", padx=15, pady=4)
         
         # Icon label with Segoe Fluent Icons
-        self._sessions_icon = tk.Label(
+        self._sessions_icon = ttk.Label(
             left_frame,
             text="\uE7FC",
-            bg=COLORS["bg_panel"],
-            fg=COLORS["fg_dim"],
-            font=("Segoe Fluent Icons", 10)
+            style=self._ICON_STYLES["fg_dim"],
         )
         self._sessions_icon.pack(side="left")
         
         # Text label with normal font
-        self.labels["sessions"] = tk.Label(
+        self.labels["sessions"] = ttk.Label(
             left_frame,
             text="Sessions: 0",
-            bg=COLORS["bg_panel"],
-            fg=COLORS["fg_dim"],
-            font=("Segoe UI", 9)
+            style=self._TEXT_STYLES["fg_dim"],
         )
         self.labels["sessions"].pack(side="left", padx=(3, 0))
 
         
         # Separator
-        tk.Frame(self.frame, bg=COLORS["border"], width=1).pack(side="left", fill="y", padx=10, pady=4)
+        register_themed(tk.Frame(self.frame, bg=COLORS["border"], width=1), bg="border").pack(side="left", fill="y", padx=10, pady=4)
         
         # Log Monitor status (clickable toggle) - split into icon + text
-        log_frame = tk.Frame(self.frame, bg=COLORS["bg_panel"], cursor="hand2")
+        log_frame = register_themed(tk.Frame(self.frame, bg=COLORS["bg_panel"], cursor="hand2"), bg="bg_panel")
         log_frame.pack(side="left", padx=5)
         
-        self._log_icon = tk.Label(
+        self._log_icon = ttk.Label(
             log_frame,
             text="\uE9D2",
-            bg=COLORS["bg_panel"],
-            fg=COLORS["fg_dim"],
-            font=("Segoe Fluent Icons", 10),
-            cursor="hand2"
+            style=self._ICON_STYLES["fg_dim"],
         )
         self._log_icon.pack(side="left")
         
-        self.labels["log_monitor"] = tk.Label(
+        self.labels["log_monitor"] = ttk.Label(
             log_frame,
             text="Log: Off",
-            bg=COLORS["bg_panel"],
-            fg=COLORS["fg_dim"],
-            font=("Segoe UI", 9),
-            cursor="hand2"
+            style=self._TEXT_STYLES["fg_dim"],
         )
         self.labels["log_monitor"].pack(side="left", padx=(3, 0))
         
-        # Bind click to both icon and text
-        log_frame.bind("<Button-1>", lambda e: self._toggle_log_monitor())
-        self._log_icon.bind("<Button-1>", lambda e: self._toggle_log_monitor())
-        self.labels["log_monitor"].bind("<Button-1>", lambda e: self._toggle_log_monitor())
+        self._bind_click("StatusLogToggle", self._toggle_log_monitor, log_frame, self._log_icon, self.labels["log_monitor"])
 
         
         # Separator
-        tk.Frame(self.frame, bg=COLORS["border"], width=1).pack(side="left", fill="y", padx=10, pady=4)
+        register_themed(tk.Frame(self.frame, bg=COLORS["border"], width=1), bg="border").pack(side="left", fill="y", padx=10, pady=4)
         
         self._create_slayer_labels()
     
+    def _bind_click(self, tag, command, *widgets):
+        """Route <Button-1> on a clickable group (frame, icon, text) through one class binding.
+
+        Tk does not propagate clicks from a Label to its parent Frame, so each widget
+        gets the shared bindtag instead of its own copy of the handler.
+        """
+        for widget in widgets:
+            widget.bindtags((tag,) + widget.bindtags())
+        self.frame.bind_class(tag, "<Button-1>", lambda e: command())
+
     def _start_resize(self, event):
         """Start window resize from bottom-right corner."""
         root = self.app.root
@@ -250,79 +342,71 @@ class StatusBar:
         self._resize_data["height"] = root.winfo_height()
     
     def _do_resize(self, event):
-        """Handle window resize drag."""
-        root = self.app.root
+        """Handle window resize drag (records the target; _flush_resize applies it)."""
         dx = event.x_root - self._resize_data["x"]
         dy = event.y_root - self._resize_data["y"]
         
         new_width = max(900, self._resize_data["width"] + dx)
         new_height = max(500, self._resize_data["height"] + dy)
         
-        x = root.winfo_x()
-        y = root.winfo_y()
-        root.geometry(f"{new_width}x{new_height}+{x}+{y}")
+        self._resize_pending = (new_width, new_height)
+        if not self._resize_scheduled:
+            self._resize_scheduled = True
+            self.app.root.after(DRAG_FRAME_INTERVAL_MS, self._flush_resize)
+
+    def _flush_resize(self):
+        """Apply the most recent size recorded by _do_resize."""
+        self._resize_scheduled = False
+        size = self._resize_pending
+        if size is None:
+            return
+        self._resize_pending = None
+        root = self.app.root
+        root.geometry(f"{size[0]}x{size[1]}+{root.winfo_x()}+{root.winfo_y()}")
         
     def _create_slayer_labels(self):
         # Hotkeys status (clickable toggle) - E765 = Keyboard icon
-        hotkeys_frame = tk.Frame(self.frame, bg=COLORS["bg_panel"], cursor="hand2")
+        hotkeys_frame = register_themed(tk.Frame(self.frame, bg=COLORS["bg_panel"], cursor="hand2"), bg="bg_panel")
         hotkeys_frame.pack(side="left", padx=5)
         
-        self._hotkeys_icon = tk.Label(
+        self._hotkeys_icon = ttk.Label(
             hotkeys_frame,
             text="\uE765",
-            bg=COLORS["bg_panel"],
-            fg=COLORS["fg_dim"],
-            font=("Segoe Fluent Icons", 10),
-            cursor="hand2"
+            style=self._ICON_STYLES["fg_dim"],
         )
         self._hotkeys_icon.pack(side="left")
         
-        self.labels["hotkeys"] = tk.Label(
+        self.labels["hotkeys"] = ttk.Label(
             hotkeys_frame,
             text="Hotkeys: Off",
-            bg=COLORS["bg_panel"],
-            fg=COLORS["fg_dim"],
-            font=("Segoe UI", 9),
-            cursor="hand2"
+            style=self._TEXT_STYLES["fg_dim"],
         )
         self.labels["hotkeys"].pack(side="left", padx=(3, 0))
         
-        # Bind click to all parts
-        hotkeys_frame.bind("<Button-1>", lambda e: self._toggle_hotkeys())
-        self._hotkeys_icon.bind("<Button-1>", lambda e: self._toggle_hotkeys())
-        self.labels["hotkeys"].bind("<Button-1>", lambda e: self._toggle_hotkeys())
+        self._bind_click("StatusHotkeysToggle", self._toggle_hotkeys, hotkeys_frame, self._hotkeys_icon, self.labels["hotkeys"])
 
         # Separator before Auto-Fog
-        tk.Frame(self.frame, bg=COLORS["border"], width=1).pack(side="left", fill="y", padx=10, pady=4)
+        register_themed(tk.Frame(self.frame, bg=COLORS["border"], width=1), bg="border").pack(side="left", fill="y", padx=10, pady=4)
         
         # Auto-Fog status (clickable toggle) - E753 = Cloud/Weather icon
-        fog_frame = tk.Frame(self.frame, bg=COLORS["bg_panel"], cursor="hand2")
+        fog_frame = register_themed(tk.Frame(self.frame, bg=COLORS["bg_panel"], cursor="hand2"), bg="bg_panel")
         fog_frame.pack(side="left", padx=5)
         
-        self._fog_icon = tk.Label(
+        self._fog_icon = ttk.Label(
             fog_frame,
             text="\uE753",
-            bg=COLORS["bg_panel"],
-            fg=COLORS["fg_dim"],
-            font=("Segoe Fluent Icons", 10),
-            cursor="hand2"
+            style=self._ICON_STYLES["fg_dim"],
         )
         self._fog_icon.pack(side="left")
         
-        self.labels["auto_fog"] = tk.Label(
+        self.labels["auto_fog"] = ttk.Label(
             fog_frame,
             text="Fog: Off",
-            bg=COLORS["bg_panel"],
-            fg=COLORS["fg_dim"],
-            font=("Segoe UI", 9),
-            cursor="hand2"
+            style=self._TEXT_STYLES["fg_dim"],
         )
         self.labels["auto_fog"].pack(side="left", padx=(3, 0))
         
-        # Bind click to all parts
-        fog_frame.bind("<Button-1>", lambda e: self._toggle_auto_fog())
-        self._fog_icon.bind("<Button-1>", lambda e: self._toggle_auto_fog())
-        self.labels["auto_fog"].bind("<Button-1>", lambda e: self._toggle_auto_fog())
+        self._bind_click("StatusFogToggle", self._toggle_auto_fog, fog_frame, self._fog_icon, self.labels["auto_fog"])
 
         # Inline tooltip for fog single-session restriction
         def _fog_show_tip(e):
@@ -354,84 +438,74 @@ class StatusBar:
             _fw.bind("<Leave>", _fog_hide_tip, add="+")
 
         # Separator before Spy
-        tk.Frame(self.frame, bg=COLORS["border"], width=1).pack(side="left", fill="y", padx=10, pady=4)
+        register_themed(tk.Frame(self.frame, bg=COLORS["border"], width=1), bg="border").pack(side="left", fill="y", padx=10, pady=4)
 
         # Spy status (clickable toggle) - E7B3 = Eye/Preview icon
-        spy_frame = tk.Frame(self.frame, bg=COLORS["bg_panel"], cursor="hand2")
+        spy_frame = register_themed(tk.Frame(self.frame, bg=COLORS["bg_panel"], cursor="hand2"), bg="bg_panel")
         spy_frame.pack(side="left", padx=5)
 
-        self._spy_icon = tk.Label(
+        self._spy_icon = ttk.Label(
             spy_frame,
             text="\uE7B3",
-            bg=COLORS["bg_panel"],
-            fg=COLORS["fg_dim"],
-            font=("Segoe Fluent Icons", 10),
-            cursor="hand2"
+            style=self._ICON_STYLES["fg_dim"],
         )
         self._spy_icon.pack(side="left")
 
-        self.labels["spy"] = tk.Label(
+        self.labels["spy"] = ttk.Label(
             spy_frame,
             text="Spy: Off",
-            bg=COLORS["bg_panel"],
-            fg=COLORS["fg_dim"],
-            font=("Segoe UI", 9),
-            cursor="hand2"
+            style=self._TEXT_STYLES["fg_dim"],
         )
         self.labels["spy"].pack(side="left", padx=(3, 0))
 
-        # Bind click to all parts
-        spy_frame.bind("<Button-1>", lambda e: self._toggle_spy())
-        self._spy_icon.bind("<Button-1>", lambda e: self._toggle_spy())
-        self.labels["spy"].bind("<Button-1>", lambda e: self._toggle_spy())
+        self._bind_click("StatusSpyToggle", self._toggle_spy, spy_frame, self._spy_icon, self.labels["spy"])
 
         # Separator before Slayer (now at end)
-        tk.Frame(self.frame, bg=COLORS["border"], width=1).pack(side="left", fill="y", padx=10, pady=4)
+        register_themed(tk.Frame(self.frame, bg=COLORS["border"], width=1), bg="border").pack(side="left", fill="y", padx=10, pady=4)
         
         # Slayer status (clickable toggle) - E81D = Cut/blade icon - NOW AT END
-        self.slayer_frame = tk.Frame(self.frame, bg=COLORS["bg_panel"], cursor="hand2")
+        self.slayer_frame = register_themed(tk.Frame(self.frame, bg=COLORS["bg_panel"], cursor="hand2"), bg="bg_panel")
         self.slayer_frame.pack(side="left", padx=5)
         
-        self._slayer_icon = tk.Label(
+        self._slayer_icon = ttk.Label(
             self.slayer_frame,
             text="\uE81D",
-            bg=COLORS["bg_panel"],
-            fg=COLORS["fg_dim"],
-            font=("Segoe Fluent Icons", 10),
-            cursor="hand2"
+            style=self._ICON_STYLES["fg_dim"],
         )
         self._slayer_icon.pack(side="left")
         
-        self.labels["slayer"] = tk.Label(
+        self.labels["slayer"] = ttk.Label(
             self.slayer_frame,
             text="Slayer: Off",
-            bg=COLORS["bg_panel"],
-            fg=COLORS["fg_dim"],
-            font=("Segoe UI", 9),
-            cursor="hand2"
+            style=self._TEXT_STYLES["fg_dim"],
         )
         self.labels["slayer"].pack(side="left", padx=(3, 0))
         
         # Slayer hit counter (separate, normal font)
-        self.labels["slayer_hits"] = tk.Label(
+        self.labels["slayer_hits"] = ttk.Label(
             self.slayer_frame,
             text="(0 hits)",
-            bg=COLORS["bg_panel"],
-            fg=COLORS["fg_dim"],
-            font=("Segoe UI", 9)
+            style=self._TEXT_STYLES["fg_dim"],
         )
         self.labels["slayer_hits"].pack(side="left", padx=(3, 0))
         
-        # Bind click to all parts
-        self.slayer_frame.bind("<Button-1>", lambda e: self._toggle_slayer())
-        self._slayer_icon.bind("<Button-1>", lambda e: self._toggle_slayer())
-        self.labels["slayer"].bind("<Button-1>", lambda e: self._toggle_slayer())
+        self._bind_click("StatusSlayerToggle", self._toggle_slayer, self.slayer_frame, self._slayer_icon, self.labels["slayer"])
 
     
+    def _debounce_toggle(self, name) -> bool:
+        """Return True if this toggle was already clicked within STATUS_TOGGLE_DEBOUNCE_SECONDS."""
+        now = time.monotonic()
+        if now - self._toggle_debounce.get(name, 0.0) < STATUS_TOGGLE_DEBOUNCE_SECONDS:
+            return True
+        self._toggle_debounce[name] = now
+        return False
+
     def _toggle_hotkeys(self):
         """Toggle hotkeys enabled state on click."""
+        if self._debounce_toggle("hotkeys"):
+            return
         try:
-            print("[StatusBar] _toggle_hotkeys clicked")
+            logging.debug("[StatusBar] _toggle_hotkeys clicked")
             var = getattr(self.app, 'hotkeys_enabled_var', None)
             if var:
                 var.set(not var.get())
@@ -448,22 +522,28 @@ class StatusBar:
                     else:
                         if hasattr(self.app, 'multi_hotkey_manager'):
                             self.app.multi_hotkey_manager.unregister_session_keys()
-                        self.update()
+                        self.request_update()
                     if hasattr(self.app, 'save_data'):
                         self.app.save_data()
+            self.app.mark_status_dirty()
         except Exception as e:
             print(f"[StatusBar] Error in _toggle_hotkeys: {e}")
     
     def _toggle_log_monitor(self):
         """Toggle log monitor on click."""
+        if self._debounce_toggle("log_monitor"):
+            return
         try:
             if hasattr(self.app, 'log_monitor_manager'):
                 self.app.log_monitor_manager.toggle_log_monitor_enabled()
+            self.app.mark_status_dirty()
         except Exception as e:
             print(f"[StatusBar] Error in _toggle_log_monitor: {e}")
     
     def _toggle_slayer(self):
         """Toggle Slayer (Open Wounds) on click."""
+        if self._debounce_toggle("slayer"):
+            return
         try:
             # Retrieve variable
             var = getattr(self.app.log_monitor_state, 'open_wounds_enabled_var', None)
@@ -471,7 +551,7 @@ class StatusBar:
                 # Toggle variable - trace will handle config save and UI updates
                 new_val = not var.get()
                 var.set(new_val)
-                print(f"[StatusBar] Toggling Slayer var to {new_val}")
+                logging.debug("[StatusBar] Toggling Slayer var to %s", new_val)
             else:
                 # Fallback if var not ready
                 settings = getattr(self.app, 'settings', None)
@@ -482,11 +562,14 @@ class StatusBar:
                         self.app.log_monitor_manager._ensure_slayer_if_enabled()
                     if hasattr(self.app, 'save_data'):
                         self.app.save_data()
+            self.app.mark_status_dirty()
         except Exception as e:
             print(f"[StatusBar] Error in _toggle_slayer: {e}")
     
     def _toggle_auto_fog(self):
         """Toggle Auto-Fog on click. Also auto-enables log monitor if turning fog on."""
+        if self._debounce_toggle("auto_fog"):
+            return
         try:
             # Retrieve variable
             var = getattr(self.app.log_monitor_state, 'auto_fog_enabled_var', None)
@@ -494,7 +577,7 @@ class StatusBar:
                 # Toggle variable - trace will handle config save and UI updates
                 new_val = not var.get()
                 var.set(new_val)
-                print(f"[StatusBar] Toggling Auto-Fog var to {new_val}")
+                logging.debug("[StatusBar] Toggling Auto-Fog var to %s", new_val)
                 
                 # If enabling fog, auto-enable log monitor
                 if new_val:
@@ -507,7 +590,7 @@ class StatusBar:
                                 enabled_var.set(True)
                             self.app.log_monitor_manager.ensure_log_monitor()
                             self.app.log_monitor_manager.start_log_monitor()
-                            print("[StatusBar] Auto-enabled Log Monitor for Fog")
+                            logging.debug("[StatusBar] Auto-enabled Log Monitor for Fog")
             else:
                 # Fallback
                 settings = getattr(self.app, 'settings', None)
@@ -515,45 +598,47 @@ class StatusBar:
                     settings.log_monitor.auto_fog.enabled = not settings.log_monitor.auto_fog.enabled
                     if hasattr(self.app, 'save_data'):
                         self.app.save_data()
+            self.app.mark_status_dirty()
         except Exception as e:
             print(f"[StatusBar] Error in _toggle_auto_fog: {e}")
 
     def _toggle_spy(self):
         """Toggle Spy (keyword tracking + Discord webhook) on click."""
+        if self._debounce_toggle("spy"):
+            return
         try:
             if hasattr(self.app, 'log_monitor_manager'):
                 self.app.log_monitor_manager.toggle_spy_enabled()
+            self.app.mark_status_dirty()
         except Exception as e:
             print(f"[StatusBar] Error in _toggle_spy: {e}")
 
-    def update(self):
-        """Update all status bar labels"""
+    def update(self, log_on=None):
+        """Update all status bar labels; `log_on` may be passed in if already known."""
         try:
             # Sessions count
-            session_count = len(getattr(self.app.sessions, "sessions", {}) or {})
+            session_count = self.app.sessions.count
             sessions_text = f"Sessions: {session_count}"
-            sessions_fg = COLORS["success"] if session_count > 0 else COLORS["fg_dim"]
-            self.labels["sessions"].config(text=sessions_text, fg=sessions_fg)
-            if hasattr(self, '_sessions_icon'):
-                self._sessions_icon.config(fg=sessions_fg)
+            sessions_role = "success" if session_count > 0 else "fg_dim"
+            self._set_label("sessions", sessions_text, sessions_role, self._sessions_icon)
             
             # Log Monitor status
+            lms = self.app.log_monitor_state
             log_monitor_cfg = self.app.settings.log_monitor
-            log_on = self.app.log_monitor_state.monitor and self.app.log_monitor_state.monitor.is_running()
+            if log_on is None:
+                log_on = lms.monitor and lms.monitor.is_running()
             log_enabled = log_monitor_cfg.enabled
             
             if log_on:
                 log_text = "Log: On"
-                log_fg = COLORS["success"]
+                log_role = "success"
             elif log_enabled:
                 log_text = "Log: Waiting"
-                log_fg = COLORS["accent"]
+                log_role = "accent"
             else:
                 log_text = "Log: Off"
-                log_fg = COLORS["fg_dim"]
-            self.labels["log_monitor"].config(text=log_text, fg=log_fg)
-            if hasattr(self, '_log_icon'):
-                self._log_icon.config(fg=log_fg)
+                log_role = "fg_dim"
+            self._set_label("log_monitor", log_text, log_role, self._log_icon)
             
             # Hotkeys status
             hotkeys_cfg = self.app.settings.hotkeys
@@ -563,7 +648,9 @@ class StatusBar:
             
             if hotkeys_cfg:
                 hotkeys_enabled = hotkeys_cfg.enabled
-                binds_count = len([b for b in hotkeys_cfg.binds if b.enabled])
+                if self._hk_binds_count is None:
+                    self._hk_binds_count = sum(1 for b in hotkeys_cfg.binds if b.enabled)
+                binds_count = self._hk_binds_count
                 hk_manager = getattr(self.app, 'multi_hotkey_manager', None)
                 is_active = hk_manager and hk_manager.is_active()
             
@@ -571,26 +658,24 @@ class StatusBar:
             
             if is_active:
                 hotkeys_text = f"Hotkeys: On ({binds_count})"
-                hotkeys_fg = COLORS["success"]
+                hotkeys_role = "success"
             elif hk_waiting:
                 # Determine WHY it's waiting
                 multi_session_disable = getattr(self.app.settings, "disable_hotkeys_on_multi_session", False)
                 if session_count > 1 and multi_session_disable:
                     hotkeys_text = "Hotkeys: Paused (Multi)"
-                    hotkeys_fg = COLORS["warning"]
+                    hotkeys_role = "warning"
                 elif self.app.multi_hotkey_manager and not self.app.multi_hotkey_manager._is_nwn_focused():
                     hotkeys_text = "Hotkeys: Waiting (Focus)"
-                    hotkeys_fg = COLORS["accent"]
+                    hotkeys_role = "accent"
                 else:
                     hotkeys_text = "Hotkeys: Waiting"
-                    hotkeys_fg = COLORS["accent"]
+                    hotkeys_role = "accent"
             else:
                 hotkeys_text = "Hotkeys: Off"
-                hotkeys_fg = COLORS["fg_dim"]
+                hotkeys_role = "fg_dim"
             
-            self.labels["hotkeys"].config(text=hotkeys_text, fg=hotkeys_fg)
-            if hasattr(self, '_hotkeys_icon'):
-                self._hotkeys_icon.config(fg=hotkeys_fg)
+            self._set_label("hotkeys", hotkeys_text, hotkeys_role, self._hotkeys_icon)
             
             # Auto-Fog status
             auto_fog_cfg = log_monitor_cfg.auto_fog
@@ -600,19 +685,17 @@ class StatusBar:
             
             if fog_paused:
                 fog_text = "Fog: Paused"
-                fog_fg = COLORS["warning"]
+                fog_role = "warning"
             elif fog_active:
                 fog_text = "Fog: On"
-                fog_fg = COLORS["success"]
+                fog_role = "success"
             elif fog_enabled:
                 fog_text = "Fog: Waiting"
-                fog_fg = COLORS["accent"]
+                fog_role = "accent"
             else:
                 fog_text = "Fog: Off"
-                fog_fg = COLORS["fg_dim"]
-            self.labels["auto_fog"].config(text=fog_text, fg=fog_fg)
-            if hasattr(self, '_fog_icon'):
-                self._fog_icon.config(fg=fog_fg)
+                fog_role = "fg_dim"
+            self._set_label("auto_fog", fog_text, fog_role, self._fog_icon)
             
             # Spy status
             spy_enabled = log_monitor_cfg.spy_enabled
@@ -620,16 +703,14 @@ class StatusBar:
             
             if spy_active:
                 spy_text = "Spy: On"
-                spy_fg = COLORS["success"]
+                spy_role = "success"
             elif spy_enabled:
                 spy_text = "Spy: Waiting"
-                spy_fg = COLORS["accent"]
+                spy_role = "accent"
             else:
                 spy_text = "Spy: Off"
-                spy_fg = COLORS["fg_dim"]
-            self.labels["spy"].config(text=spy_text, fg=spy_fg)
-            if hasattr(self, '_spy_icon'):
-                self._spy_icon.config(fg=spy_fg)
+                spy_role = "fg_dim"
+            self._set_label("spy", spy_text, spy_role, self._spy_icon)
             
             # Slayer visibility: only show for non-siala server groups
             current_group = getattr(self.app, 'server_group', 'siala')
@@ -640,29 +721,53 @@ class StatusBar:
             slayer_enabled = slayer_cfg.enabled
             
             # Check both main monitor and standalone slayer monitor
-            slayer_monitor_running = self.app.log_monitor_state.slayer_monitor and self.app.log_monitor_state.slayer_monitor.is_running()
+            slayer_monitor_running = lms.slayer_monitor and lms.slayer_monitor.is_running()
             slayer_active = slayer_enabled and (log_on or slayer_monitor_running)
             
             if slayer_active:
                 slayer_text = f"Slayer: On ({slayer_cfg.key})"
-                slayer_fg = COLORS["warning"]
+                slayer_role = "warning"
             elif slayer_enabled:
                 slayer_text = "Slayer: Waiting"
-                slayer_fg = COLORS["accent"]
+                slayer_role = "accent"
             else:
                 slayer_text = "Slayer: Off"
-                slayer_fg = COLORS["fg_dim"]
-            self.labels["slayer"].config(text=slayer_text, fg=slayer_fg)
-            if hasattr(self, '_slayer_icon'):
-                self._slayer_icon.config(fg=slayer_fg)
+                slayer_role = "fg_dim"
+            self._set_label("slayer", slayer_text, slayer_role, self._slayer_icon)
             
             # Slayer hits
-            hits_text = f"({self.app.log_monitor_state.slayer_hit_count} hits)"
-            hits_fg = COLORS["warning"] if self.app.log_monitor_state.slayer_hit_count > 0 else COLORS["fg_dim"]
-            self.labels["slayer_hits"].config(text=hits_text, fg=hits_fg)
+            hit_count = lms.slayer_hit_count
+            hits_text = f"({hit_count} hits)"
+            hits_role = "warning" if hit_count > 0 else "fg_dim"
+            self._set_label("slayer_hits", hits_text, hits_role)
         except Exception as e:
             print(f"[StatusBar] Update error: {e}")
 
+    def invalidate_hotkey_count(self):
+        """Drop the cached enabled-bind count; call after hotkey binds are edited or reloaded."""
+        self._hk_binds_count = None
+
+    def request_update(self):
+        """Schedule update() on the next idle pass; repeated requests collapse into one."""
+        if self._update_dirty:
+            return
+        self._update_dirty = True
+        self.app.root.after_idle(self._flush_update)
+
+    def _flush_update(self):
+        self._update_dirty = False
+        self.update()
+
+    def _set_label(self, key, text, role, icon=None):
+        """Write text and state style to a status label (and its icon) only if they changed."""
+        state = (text, role)
+        if self._label_state.get(key) == state:
+            return
+        self._label_state[key] = state
+        self.labels[key].configure(text=text, style=self._TEXT_STYLES[role])
+        if icon is not None:
+            icon.configure(style=self._ICON_STYLES[role])
+
     def set_slayer_visibility(self, visible: bool):
         """Show or hide the Slayer configuration section in status bar."""
         try:
@@ -683,25 +788,40 @@ class StatusBar:
 
     def apply_theme(self):
         """Update colors for theme switch"""
-        self.frame.config(bg=COLORS["bg_panel"])
-        if hasattr(self, 'resize_grip'):
-            self.resize_grip.config(bg=COLORS["bg_panel"], fg=COLORS["fg_dim"])
-        
-        # Update labels background
-        for label in self.labels.values():
-            label.config(bg=COLORS["bg_panel"])
-        
-        # Update separate icon labels
-        for attr in ['_sessions_icon', '_log_icon', '_hotkeys_icon', '_fog_icon', '_spy_icon', '_slayer_icon']:
-            if hasattr(self, attr):
-                getattr(self, attr).config(bg=COLORS["bg_panel"])
-        
-        # Force immediate update of foregrounds
-        self.update()
+        fp = palette_fingerprint()
+        if fp == self._palette_fp:
+            return
+        self._palette_fp = fp
+        bg_panel = COLORS["bg_panel"]
+        self.frame.config(bg=bg_panel)
+        self.resize_grip.config(bg=bg_panel, fg=COLORS["fg_dim"])
+        
+        # State labels pick up the new palette through their shared styles
+        self._configure_status_styles()
+        self.labels["save_state"].config(bg=bg_panel, fg=COLORS["fg_text"])
+        self._save_icon.config(bg=bg_panel, fg=COLORS["accent"])
+        
+        # Refresh state on the next idle pass, together with the rest of the re-theme
+        self.request_update()
+
+    def _configure_status_styles(self):
+        """(Re)define the per-state text and icon label styles from COLORS."""
+        style = ttk.Style()
+        bg_panel = COLORS["bg_panel"]
+        for role in self._STATE_ROLES:
+            fg = COLORS[role]
+            # padding=3 matches the classic Label's default border + pad
+            style.configure(self._TEXT_STYLES[role], background=bg_panel, foreground=fg,
+                            font=("Segoe UI", 9), padding=3)
+            style.configure(self._ICON_STYLES[role], background=bg_panel, foreground=fg,
+                            font=("Segoe Fluent Icons", 10), padding=3)
 
 
 class NavigationBar:
     """Navigation bar with large accent-colored icons and text labels."""
+
+    # Extra characters update_indicators may append: "Home (99)", "Log Monitor 🟢"
+    _INDICATOR_RESERVE = {"home": 5, "log_monitor": 2}
     
     def __init__(self, app, parent):
         self.app = app
@@ -709,7 +829,13 @@ class NavigationBar:
         self.buttons = {}  # screen -> frame widget
         self._icons = {}   # screen -> icon label
         self._labels = {}  # screen -> text label
+        self._indicator_state = None  # (session_count, log_on) last shown by update_indicators
+        self._colors_state = {}  # screen -> (bg, fg, icon_fg) last applied by _set_colors
+        self._widget_screen = {}  # frame/icon/label widget -> screen, for the shared handlers
         self._hovered = set()
+        # Palette the widgets were last colored with, see apply_theme
+        self._palette_fp = palette_fingerprint()
+        self._snapshot_colors()
         
         self.frame = tk.Frame(self.parent, bg=COLORS["bg_panel"])
         self.frame.pack(side="left", padx=20, pady=10)
@@ -757,6 +883,12 @@ class NavigationBar:
                 font=("Segoe UI", 10),
                 cursor="hand2",
             )
+            # Labels whose text update_indicators changes get a fixed width sized for
+            # the longest variant, so indicator changes don't re-layout the whole bar;
+            # left-anchored so the base text stays next to its icon
+            reserve = self._INDICATOR_RESERVE.get(screen)
+            if reserve:
+                text_lbl.config(width=len(text) + reserve, anchor="w")
             text_lbl.pack(side="left", anchor="center")
             
             # Store references
@@ -764,14 +896,16 @@ class NavigationBar:
             self._icons[screen] = icon_lbl
             self._labels[screen] = text_lbl
             
-            # Bind click to frame and both labels
-            for widget in [btn_frame, icon_lbl, text_lbl]:
-                widget.bind("<Button-1>", lambda e, s=screen: self._on_click(s))
-            
-            # Hover
-            btn_frame.bind("<Enter>", lambda e, s=screen: self._on_hover(s, True), add="+")
-            btn_frame.bind("<Leave>", lambda e, s=screen: self._on_hover(s, False), add="+")
-            
+            # Click on the frame and both labels, hover on the frame only; the
+            # handlers are registered once below on the shared bindtags
+            for widget in (btn_frame, icon_lbl, text_lbl):
+                self._widget_screen[widget] = screen
+                widget.bindtags(("NavButton",) + widget.bindtags())
+            btn_frame.bindtags(("NavButtonHover",) + btn_frame.bindtags())
+
+        self.frame.bind_class("NavButton", "<Button-1>", lambda e: self._on_click(self._widget_screen[e.widget]))
+        self.frame.bind_class("NavButtonHover", "<Enter>", lambda e: self._on_hover(self._widget_screen[e.widget], True))
+        self.frame.bind_class("NavButtonHover", "<Leave>", lambda e: self._on_hover(self._widget_screen[e.widget], False))
 
     
     def _on_click(self, screen):
@@ -785,7 +919,7 @@ class NavigationBar:
                 return
             self._hovered.add(screen)
             if screen != self.app.current_screen:
-                self._set_colors(screen, COLORS["bg_input"], COLORS["fg_text"])
+                self._set_colors(screen, *self._state_colors["hover"])
         else:
             if screen not in self._hovered:
                 return
@@ -794,10 +928,14 @@ class NavigationBar:
     
     def _set_colors(self, screen, bg, fg, icon_fg=None):
         """Set colors for a button. Icon keeps accent color unless specified."""
+        colors = (bg, fg, icon_fg or COLORS["accent"])
+        if self._colors_state.get(screen) == colors:
+            return
         try:
             self.buttons[screen].configure(bg=bg)
-            self._icons[screen].configure(bg=bg, fg=icon_fg or COLORS["accent"])
+            self._icons[screen].configure(bg=bg, fg=colors[2])
             self._labels[screen].configure(bg=bg, fg=fg)
+            self._colors_state[screen] = colors
         except Exception:
             pass
     
@@ -816,39 +954,60 @@ class NavigationBar:
     def _update_style(self, screen):
         """Update button style based on active screen."""
         if screen == self.app.current_screen:
-            # Active: accent bg, dark text, white icon
-            self._set_colors(screen, COLORS["accent"], COLORS["text_dark"], COLORS["text_dark"])
+            self._set_colors(screen, *self._state_colors["active"])
         else:
+            self._set_colors(screen, *self._state_colors["inactive"])
+
+    def _snapshot_colors(self):
+        """Resolve (bg, fg, icon_fg) per button state from the current palette."""
+        accent = COLORS["accent"]
+        text_dark = COLORS["text_dark"]
+        fg_text = COLORS["fg_text"]
+        self._state_colors = {
+            # Active: accent bg, dark text, dark icon
+            "active": (accent, text_dark, text_dark),
             # Inactive: panel bg, normal text, accent icon
-            self._set_colors(screen, COLORS["bg_panel"], COLORS["fg_text"], COLORS["accent"])
+            "inactive": (COLORS["bg_panel"], fg_text, accent),
+            "hover": (COLORS["bg_input"], fg_text, accent),
+        }
 
     def update_btn_style(self, btn, screen_name):
         """Legacy method for compatibility."""
         self._update_style(screen_name)
 
-    def update_indicators(self):
-        """Update indicators on navigation buttons."""
+    def update_indicators(self, log_on=None):
+        """Update indicators on navigation buttons; `log_on` may be passed in if already known."""
         try:
+            session_count = self.app.sessions.count
+            if log_on is None:
+                monitor = self.app.log_monitor_state.monitor
+                log_on = monitor and monitor.is_running()
+            log_on = bool(log_on)
+            state = (session_count, log_on)
+            if state == self._indicator_state:
+                return
+            prev_count, prev_log_on = self._indicator_state or (None, None)
+            self._indicator_state = state
+
             # Home sessions indicator
-            session_count = len(getattr(self.app.sessions, "sessions", {}) or {})
-            home_text = f"Home ({session_count})" if session_count > 0 else "Home"
-            if "home" in self._labels:
-                current = self._labels["home"].cget("text")
-                if current != home_text:
-                    self._labels["home"].config(text=home_text)
+            if session_count != prev_count and "home" in self._labels:
+                home_text = f"Home ({session_count})" if session_count > 0 else "Home"
+                self._labels["home"].config(text=home_text)
             
             # Log monitor active indicator
-            log_on = self.app.log_monitor_state.monitor and self.app.log_monitor_state.monitor.is_running()
-            log_text = "Log Monitor 🟢" if log_on else "Log Monitor"
-            if "log_monitor" in self._labels:
-                current = self._labels["log_monitor"].cget("text")
-                if current != log_text:
-                    self._labels["log_monitor"].config(text=log_text)
+            if log_on != prev_log_on and "log_monitor" in self._labels:
+                log_text = "Log Monitor 🟢" if log_on else "Log Monitor"
+                self._labels["log_monitor"].config(text=log_text)
         except Exception:
             pass
 
     def apply_theme(self):
         """Update all buttons for theme switch."""
+        fp = palette_fingerprint()
+        if fp == self._palette_fp:
+            return
+        self._palette_fp = fp
+        self._snapshot_colors()
         try:
             self.frame.config(bg=COLORS["bg_panel"])
             for screen in self.buttons:
@@ -4,6 +4,7 @@ import tkinter as tk
 from tkinter import messagebox
 from datetime import datetime
 from ui.ui_base import BaseDialog, ModernButton, COLORS
+from core.storage import flush_pending_writes
 
 
 class RestoreBackupDialog(BaseDialog):
@@ -189,6 +190,9 @@ class RestoreBackupDialog(BaseDialog):
             parent=self,
         ):
             try:
+                # Let queued saves land first so they can't overwrite the restored file
+                flush_pending_writes()
+
                 # Create a backup of current settings before restoring
                 if os.path.exists(self.settings_path):
                     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
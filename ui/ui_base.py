@@ -37,6 +37,13 @@ FONT_FAMILY = "Mona Sans"
 TOOLTIPS_ENABLED = True
 _MODERN_BUTTONS = weakref.WeakSet()
 _TITLEBAR_BUTTONS = weakref.WeakSet()
+# widget -> {option: COLORS key}, recolored in place by apply_registered_theme()
+_THEMED_WIDGETS = weakref.WeakKeyDictionary()
+# widget -> tooltip text; every registered widget shares the "Tooltip" bindtag
+# and one lazily created popup, see register_tooltip()
+_TOOLTIP_TEXTS = weakref.WeakKeyDictionary()
+_TOOLTIP_DELAY_MS = 500
+_tooltip_state: Dict[str, Any] = {"bound": False, "win": None, "label": None, "after": None, "widget": None}
 
 
 
@@ -75,7 +82,6 @@ class ModernButton(tk.Button):
         self._fg_key: Optional[str] = None
         self._trace_id: Optional[str] = None
         self._tooltip_text: Optional[str] = None
-        self._tooltip: Optional[Any] = None
         self._user_fg = user_fg  # Remember if user explicitly set fg
         try:
             for k, v in COLORS.items():
@@ -108,20 +114,11 @@ class ModernButton(tk.Button):
             pass
 
     def enable_tooltip(self):
-        if self._tooltip_text and not self._tooltip:
-            self._tooltip = ToolTip(self, self._tooltip_text)
+        if self._tooltip_text:
+            register_tooltip(self, self._tooltip_text)
 
     def disable_tooltip(self):
-        if getattr(self, "_tooltip", None):
-            try:
-                self._tooltip.hide_tooltip()
-            except Exception:
-                pass
-            try:
-                self._tooltip.widget.unbind("<Enter>")
-                self._tooltip.widget.unbind("<Leave>")
-            except Exception:
-                pass
+        unregister_tooltip(self)
 
     def update_colors(self, colors_map: dict):
         """Remap button colors using stored semantic keys for theme switching."""
@@ -231,7 +228,6 @@ class AnimatedIconButton(ModernButton):
             self.after(25, lambda: self._animate(expanding, step + 1))
         except Exception:
             pass
-            self._tooltip = None
 
     def update_colors(self, colors_map: dict):
         """Remap button colors using stored semantic keys (more reliable than value comparison)."""
@@ -663,6 +659,123 @@ def set_tooltips_enabled(enabled: bool):
             pass
 
 
+def register_tooltip(widget, text: str):
+    """Show text in the shared tooltip popup while the pointer rests on widget."""
+    _TOOLTIP_TEXTS[widget] = text
+    tags = widget.bindtags()
+    if "Tooltip" not in tags:
+        widget.bindtags(tags + ("Tooltip",))
+    if not _tooltip_state["bound"]:
+        widget.bind_class("Tooltip", "<Enter>", _tooltip_enter)
+        widget.bind_class("Tooltip", "<Leave>", _tooltip_leave)
+        widget.bind_class("Tooltip", "<ButtonPress>", _tooltip_hide)
+        _tooltip_state["bound"] = True
+
+
+def unregister_tooltip(widget):
+    """Stop showing a tooltip for widget; its bindtag stays but becomes inert."""
+    if _TOOLTIP_TEXTS.pop(widget, None) is not None and _tooltip_state["widget"] is widget:
+        _tooltip_hide()
+
+
+def _tooltip_enter(event):
+    widget = event.widget
+    if not TOOLTIPS_ENABLED or widget not in _TOOLTIP_TEXTS:
+        return
+    if _tooltip_state["widget"] is widget:
+        # Back from one of the widget's own children: tooltip already pending/shown
+        return
+    _tooltip_hide()
+    _tooltip_state["widget"] = widget
+    _tooltip_state["after"] = widget.after(_TOOLTIP_DELAY_MS, _tooltip_show)
+
+
+def _tooltip_show():
+    _tooltip_state["after"] = None
+    widget = _tooltip_state["widget"]
+    text = _TOOLTIP_TEXTS.get(widget) if widget is not None else None
+    if not text:
+        return
+    try:
+        win = _tooltip_state["win"]
+        if win is None or not win.winfo_exists():
+            win = tk.Toplevel(widget._root())
+            win.withdraw()
+            win.overrideredirect(True)
+            label = tk.Label(win, justify="left", padx=6, pady=3, font=("Segoe UI", 9))
+            label.pack()
+            _tooltip_state["win"] = win
+            _tooltip_state["label"] = label
+        _tooltip_state["label"].configure(
+            text=text,
+            bg=COLORS.get("tooltip_bg", COLORS["bg_root"]),
+            fg=COLORS["fg_text"],
+        )
+        x = widget.winfo_rootx() + 10
+        y = widget.winfo_rooty() + widget.winfo_height() + 4
+        win.geometry(f"+{x}+{y}")
+        win.deiconify()
+        win.lift()
+    except Exception:
+        pass
+
+
+def _tooltip_leave(event):
+    # Tk sends <Leave> when the pointer moves onto a child; only hide once it
+    # has left the registered widget altogether
+    widget = event.widget
+    try:
+        under = widget.winfo_containing(*widget.winfo_pointerxy())
+    except Exception:
+        under = None
+    if under is not None and (under is widget or str(under).startswith(f"{widget}.")):
+        return
+    _tooltip_hide()
+
+
+def _tooltip_hide(_event=None):
+    pending = _tooltip_state["after"]
+    widget = _tooltip_state["widget"]
+    _tooltip_state["after"] = None
+    _tooltip_state["widget"] = None
+    try:
+        if pending is not None and widget is not None:
+            widget.after_cancel(pending)
+        win = _tooltip_state["win"]
+        if win is not None and win.winfo_exists():
+            win.withdraw()
+    except Exception:
+        pass
+
+
+def register_themed(widget, **roles):
+    """Record which COLORS keys drive a widget's color options, e.g. bg="bg_panel".
+
+    Returns the widget so construction can be wrapped inline.
+    """
+    _THEMED_WIDGETS[widget] = roles
+    return widget
+
+
+def has_themed_widgets() -> bool:
+    return len(_THEMED_WIDGETS) > 0
+
+
+def apply_registered_theme():
+    """Reconfigure every registered widget from the current COLORS palette."""
+    for widget, roles in list(_THEMED_WIDGETS.items()):
+        try:
+            if widget.winfo_exists():
+                widget.configure(**{opt: COLORS[key] for opt, key in roles.items()})
+        except Exception:
+            pass
+
+
+def palette_fingerprint() -> int:
+    """Hash of the current COLORS palette, for skipping re-theming when nothing changed."""
+    return hash(tuple(sorted(COLORS.items())))
+
+
 def bind_hover_effects(widget, normal_bg, hover_bg, normal_fg=None, hover_fg=None):
     """Utility to bind hover background/foreground changes to a widget."""
     def on_enter(e):
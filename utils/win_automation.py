@@ -89,6 +89,8 @@ WM_MOUSEMOVE = 0x0200
 WM_LBUTTONDOWN = 0x0201
 WM_LBUTTONUP = 0x0202
 WM_INPUTLANGCHANGEREQUEST = 0x0050
+WM_NCLBUTTONDOWN = 0x00A1
+HTCAPTION = 2
 MK_LBUTTON = 0x0001
 HKL_NEXT = 1
 